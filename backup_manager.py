@@ -291,6 +291,7 @@ class BackupManager:
             blob_client.upload_blob(
                 backup_data, 
                 overwrite=True,
+                max_concurrency=Config.BLOB_TRANSFER_CONCURRENCY,
                 metadata={
                     'backup_type': 'database',
                     'created_at': datetime.now().isoformat(),
@@ -342,7 +343,7 @@ class BackupManager:
                 except (json.JSONDecodeError, UnicodeDecodeError):
                     latest_data = backup_data
             
-            latest_blob_client.upload_blob(latest_data, overwrite=True)
+            latest_blob_client.upload_blob(latest_data, overwrite=True, max_concurrency=Config.BLOB_TRANSFER_CONCURRENCY)
             
         except Exception as e:
             logging.warning(f"Failed to create latest backup: {str(e)}")
@@ -403,7 +404,7 @@ class BackupManager:
                 logging.error(f"Backup not found: {backup_name}")
                 return None
             
-            return blob_client.download_blob().readall()
+            return blob_client.download_blob(max_concurrency=Config.BLOB_TRANSFER_CONCURRENCY).readall()
             
         except Exception as e:
             logging.error(f"Failed to download backup {backup_name}: {str(e)}")
@@ -4,12 +4,82 @@ import logging
 import tempfile
 import threading
 import time
+import queue
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Iterator
 from azure.storage.blob import BlobServiceClient, BlobClient
 from azure.core.exceptions import ResourceNotFoundError
 from config import Config
 
+class SQLiteConnectionPool:
+    """Thread-safe pool of SQLite connections to the local database file"""
+    
+    def __init__(self, db_path: str, max_size: int = 10):
+        self.db_path = db_path
+        self.max_size = max_size
+        self._idle = queue.LifoQueue(maxsize=max_size)
+        self._lock = threading.Lock()
+        self._generation = 0
+    
+    def _create_connection(self) -> sqlite3.Connection:
+        # Connections are shared across Streamlit script threads, so disable
+        # sqlite3's same-thread check; the pool guarantees one user at a time
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA busy_timeout = 30000")
+        return conn
+    
+    def acquire(self) -> Tuple[sqlite3.Connection, int]:
+        """Check out an idle connection or open a new one"""
+        with self._lock:
+            generation = self._generation
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._create_connection()
+        return conn, generation
+    
+    def release(self, conn: sqlite3.Connection, generation: int):
+        """Return a connection to the pool, closing it if the pool is full or stale"""
+        conn.row_factory = None
+        with self._lock:
+            stale = generation != self._generation
+        if not stale and conn.in_transaction:
+            # Never park an open transaction: it would hold the write lock for every other writer
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                stale = True
+        if stale:
+            conn.close()
+            return
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+    
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Context manager yielding a pooled connection; rolls back uncommitted work on error"""
+        conn, generation = self.acquire()
+        try:
+            yield conn
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.release(conn, generation)
+    
+    def clear(self):
+        """Close idle connections and retire checked-out ones (e.g. after the DB file is replaced)"""
+        with self._lock:
+            self._generation += 1
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
 class BlobDatabaseManager:
     """Manages SQLite database stored in Azure Blob Storage"""
     
@@ -22,6 +92,7 @@ class BlobDatabaseManager:
         self.sync_lock = threading.Lock()
         self.is_syncing = False
         self.force_download_on_next_connection = False
+        self.pool = SQLiteConnectionPool(self.local_db_path, max_size=Config.DB_POOL_SIZE)
         
         # Initialize blob storage client
         if Config.AZURE_STORAGE_CONNECTION_STRING:
@@ -91,6 +162,9 @@ class BlobDatabaseManager:
                 os.remove(self.local_db_path)
             os.rename(temp_path, self.local_db_path)
             
+            # Pooled connections still point at the replaced file
+            self.pool.clear()
+            
             self.last_sync_time = datetime.now()
             logging.info(f"Database downloaded successfully to {self.local_db_path}")
             return True
@@ -250,6 +324,17 @@ class BlobDatabaseManager:
         
         return sqlite3.connect(self.local_db_path)
     
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Get a pooled SQLite connection to the local database"""
+        # Force download if flagged or if local database doesn't exist
+        if self.force_download_on_next_connection or not os.path.exists(self.local_db_path):
+            self._download_database(force=True)
+            self.force_download_on_next_connection = False
+        
+        with self.pool.connection() as conn:
+            yield conn
+    
     def sync_to_blob(self, force: bool = False) -> bool:
         """Manually sync local database to blob storage - BLOCKING operation"""
         success = self._upload_database(force=force)
@@ -280,6 +365,7 @@ class BlobDatabaseManager:
     def force_refresh(self) -> bool:
         """Force refresh database from blob storage (lose local changes)"""
         try:
+            self.pool.clear()
             if os.path.exists(self.local_db_path):
                 os.remove(self.local_db_path)
             return self._download_database(force=True)
@@ -337,6 +423,7 @@ class BlobDatabaseManager:
         try:
             # Final sync before cleanup
             self._upload_database(force=True)
+            self.pool.clear()
             
             if os.path.exists(self.local_db_path):
                 os.remove(self.local_db_path)
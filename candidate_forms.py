@@ -1,7 +1,14 @@
 import streamlit as st
-import tempfile
-import os
-from session_management import clear_form_session_state, clear_overwrite_dialog_state, clear_all_candidate_state
+import uuid
+import copy
+import hashlib
+import html
+import json
+from session_management import (
+    clear_form_session_state, clear_overwrite_dialog_state, clear_all_candidate_state,
+    get_db_manager, get_cv_processor, lookup_existing_candidate, clear_candidate_caches,
+    reset_table_editors
+)
 
 def upload_cv_tab():
     st.markdown('<div class="section-header"><h2>📄 Add New Candidate</h2></div>', unsafe_allow_html=True)
@@ -9,23 +16,22 @@ def upload_cv_tab():
     # Add "Add New Candidate" button at the top
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
+        # The callback clears the state before this run renders, so no second st.rerun() is needed
         if st.button("🆕 Add New Candidate", type="secondary", use_container_width=True, 
-                     help="Clear all data and start fresh for a new candidate", key="add_new_candidate_btn"):
-            clear_all_candidate_state()
+                     help="Clear all data and start fresh for a new candidate", key="add_new_candidate_btn",
+                     on_click=clear_all_candidate_state):
             st.success("✅ Ready for new candidate! You can now upload a new CV or enter data manually.")
-            st.rerun()
     
     st.markdown("---")
     
     # Entry method selection
-    st.markdown('<div class="entry-method">', unsafe_allow_html=True)
-    entry_method = st.radio(
-        "How would you like to add the candidate?",
-        ["📄 Upload CV and Process", "✏️ Manual Entry"],
-        key="entry_method",
-        help="Choose between uploading a CV for AI processing or manually entering candidate details"
-    )
-    st.markdown('</div>', unsafe_allow_html=True)
+    with st.container(border=True):
+        entry_method = st.radio(
+            "How would you like to add the candidate?",
+            ["📄 Upload CV and Process", "✏️ Manual Entry"],
+            key="entry_method",
+            help="Choose between uploading a CV for AI processing or manually entering candidate details"
+        )
     
     if entry_method == "📄 Upload CV and Process":
         cv_upload_section()
@@ -35,27 +41,28 @@ def upload_cv_tab():
 def cv_upload_section():
     """CV Upload and Processing Section"""
     # Professional upload container
-    with st.container():
-        st.markdown('<div class="form-container">', unsafe_allow_html=True)
+    with st.container(border=True):
         st.markdown("### 📄 Upload CV File")
-        uploaded_file = st.file_uploader(
-            "Choose a PDF CV file", 
+        uploaded_files = st.file_uploader(
+            "Choose one or more PDF CV files", 
             type="pdf",
-            help="Upload a PDF resume/CV file for AI-powered data extraction"
+            accept_multiple_files=True,
+            help="Upload PDF resume/CV files for AI-powered data extraction; several CVs are extracted together"
         )
-        st.markdown('</div>', unsafe_allow_html=True)
     
-    # Process CV only if file is uploaded and not already processed
-    if uploaded_file is not None and not st.session_state.cv_processed:
+    if len(uploaded_files) > 1:
+        cv_batch_section(uploaded_files)
+        pdf_bytes = None
+    else:
+        pdf_bytes = uploaded_files[0].getvalue() if uploaded_files else None
+    pdf_sha = hashlib.blake2b(pdf_bytes, digest_size=16).hexdigest() if pdf_bytes else None
+    
+    # Process CV only if file is uploaded and not already processed (a different file replaces the current one)
+    if pdf_bytes and (not st.session_state.cv_processed or pdf_sha != st.session_state.get('processed_pdf_sha')):
         with st.spinner("🔄 Processing CV... Please wait"):
             try:
-                # Save uploaded file temporarily
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-                    tmp_file.write(uploaded_file.read())
-                    tmp_file_path = tmp_file.name
-                
-                # Extract text from PDF
-                extracted_text = st.session_state.cv_processor.extract_text_from_pdf(tmp_file_path)
+                # Extract text from PDF (cached on the file contents)
+                extracted_text = extract_cv_text(pdf_bytes)
                 
                 if extracted_text:
                     st.markdown('<div class="success-message">✅ CV text extracted successfully!</div>', unsafe_allow_html=True)
@@ -64,13 +71,17 @@ def cv_upload_section():
                     with st.expander("📄 View Extracted Text", expanded=False):
                         st.text_area("Raw CV Text", extracted_text, height=200, disabled=True)
                     
-                    # Process with OpenAI - THIS ONLY RUNS ONCE
+                    # Process with OpenAI - cached, so a duplicate CV skips the API call
                     with st.spinner("🤖 Analyzing CV with AI... This may take a moment for comprehensive extraction"):
-                        candidate_data = st.session_state.cv_processor.process_cv_with_openai(extracted_text)
+                        try:
+                            candidate_data = process_cv_text(extracted_text)
+                        except CVProcessingError:
+                            candidate_data = None
                         
                         if candidate_data:
                             st.session_state.extracted_data = candidate_data
                             st.session_state.cv_processed = True
+                            st.session_state.processed_pdf_sha = pdf_sha
                             st.session_state.manual_entry_mode = False
                             
                             # Enhanced initialization of form data from extracted data
@@ -83,9 +94,6 @@ def cv_upload_section():
                         else:
                             st.markdown('<div class="error-message">❌ Failed to process CV with AI. Please try again or use manual entry.</div>', unsafe_allow_html=True)
                 
-                # Clean up temp file
-                os.unlink(tmp_file_path)
-                
             except Exception as e:
                 st.markdown(f'<div class="error-message">❌ Error processing CV: {str(e)}</div>', unsafe_allow_html=True)
     
@@ -93,6 +101,76 @@ def cv_upload_section():
     if st.session_state.cv_processed and st.session_state.extracted_data:
         show_candidate_form()
 
+def cv_batch_section(uploaded_files):
+    """Extract several uploaded CVs together and let the user review them one at a time"""
+    files = [(f.name, f.getvalue()) for f in uploaded_files]
+    batch_sha = hashlib.blake2b(b"".join(hashlib.blake2b(data, digest_size=16).digest() for _, data in files),
+                                digest_size=16).hexdigest()
+    
+    batch = st.session_state.get('cv_batch')
+    if not batch or batch['sha'] != batch_sha:
+        with st.spinner(f"🤖 Analyzing {len(files)} CVs with AI... This may take a moment"):
+            texts = [extract_cv_text(data) for _, data in files]
+            extracted = iter(get_cv_processor().process_cvs_batch([text for text in texts if text]))
+            batch = {
+                'sha': batch_sha,
+                'results': [(name, next(extracted) if text else None) for (name, _), text in zip(files, texts)]
+            }
+        st.session_state.cv_batch = batch
+    
+    results = batch['results']
+    processed = [i for i, (_, data) in enumerate(results) if data]
+    st.markdown(f'<div class="success-message">✅ Processed {len(processed)} of {len(results)} CVs with AI</div>', unsafe_allow_html=True)
+    st.dataframe(
+        [{
+            'File': name,
+            'Name': data.get('name', '') if data else '',
+            'Email': data.get('email', '') if data else '',
+            'Current Role': data.get('current_role', '') if data else '',
+            'Positions': len(data.get('experience', [])) if data else 0,
+            'Skills': len(data.get('skills', [])) if data else 0,
+            'Status': '✅ Extracted' if data else '❌ Failed'
+        } for name, data in results],
+        hide_index=True,
+        use_container_width=True
+    )
+    
+    if processed:
+        col1, col2 = st.columns([3, 1], vertical_alignment="bottom")
+        with col1:
+            selected = st.selectbox(
+                "Candidate to review",
+                processed,
+                format_func=lambda i: f"{results[i][0]} - {results[i][1].get('name') or 'Unknown'}",
+                key="cv_batch_selected"
+            )
+        with col2:
+            st.button("📝 Review & Save", key="cv_batch_load_btn", type="primary", use_container_width=True,
+                      on_click=load_batch_candidate, args=(results[selected][1],))
+
+def load_batch_candidate(candidate_data):
+    """Button callback: load one CV from an uploaded batch into the candidate form"""
+    st.session_state.extracted_data = candidate_data
+    st.session_state.cv_processed = True
+    st.session_state.manual_entry_mode = False
+    initialize_form_data_enhanced(candidate_data)
+
+class CVProcessingError(Exception):
+    """Raised when the AI extraction step fails, so the failure is not cached"""
+
+@st.cache_data(show_spinner=False)
+def extract_cv_text(pdf_bytes):
+    """Extract text from an uploaded PDF, memoized on the file contents"""
+    return get_cv_processor().extract_text_from_pdf_bytes(pdf_bytes)
+
+@st.cache_data(show_spinner=False)
+def process_cv_text(cv_text):
+    """Run the OpenAI extraction for a CV, memoized on the CV text"""
+    candidate_data = get_cv_processor().process_cv_with_openai(cv_text)
+    if not candidate_data:
+        raise CVProcessingError("Failed to process CV with AI")
+    return candidate_data
+
 def show_extraction_summary(candidate_data):
     """Show summary of what was extracted from the CV"""
     with st.expander("🎯 Extraction Summary - Click to see what was found", expanded=True):
@@ -148,6 +226,8 @@ def manual_entry_section():
 
 def initialize_manual_entry_form():
     """Initialize form for manual entry with empty data"""
+    reset_table_editors()
+    
     # Initialize dynamic lists first
     st.session_state.qualifications_list = []
     st.session_state.skills_list = []
@@ -169,6 +249,7 @@ def initialize_form_data_enhanced(data):
     import logging
     
     logging.info("Initializing form data with enhanced extraction")
+    reset_table_editors()
     
     # Initialize form fields with extracted data
     st.session_state.form_name = data.get('name', '')
@@ -229,9 +310,10 @@ def initialize_form_data_enhanced(data):
                     'employment_type': exp.get('employment_type', ''),
                     'team_size': exp.get('team_size', ''),
                     'reporting_to': exp.get('reporting_to', ''),
-                    'responsibilities': exp.get('responsibilities', []) if isinstance(exp.get('responsibilities', []), list) else [exp.get('responsibilities', '')],
-                    'achievements': exp.get('achievements', []) if isinstance(exp.get('achievements', []), list) else [exp.get('achievements', '')],
-                    'technologies': exp.get('technologies', []) if isinstance(exp.get('technologies', []), list) else []
+                    # Copy the nested lists so form edits never write back into extracted_data
+                    'responsibilities': list(exp.get('responsibilities', [])) if isinstance(exp.get('responsibilities', []), list) else [exp.get('responsibilities', '')],
+                    'achievements': list(exp.get('achievements', [])) if isinstance(exp.get('achievements', []), list) else [exp.get('achievements', '')],
+                    'technologies': list(exp.get('technologies', [])) if isinstance(exp.get('technologies', []), list) else []
                 }
                 # Ensure responsibilities has at least one entry for UI
                 if not enhanced_exp['responsibilities']:
@@ -258,419 +340,326 @@ def initialize_form_data_enhanced(data):
     logging.info(f"  - Achievements: {len(st.session_state.achievements_list)}")
     logging.info(f"  - Comments: {st.session_state.form_comments[:30] + '...' if len(st.session_state.form_comments) > 30 else st.session_state.form_comments}")
 
+# Skill proficiency levels shown beside every skills editor
+_PROF_LABELS = ('1 - Beginner', '2 - Basic', '3 - Intermediate', '4 - Advanced', '5 - Expert')
+
+_QUAL_COLUMNS = ['qualification', 'institution', 'year', 'grade']
+_SKILL_COLUMNS = ['skill', 'proficiency']
+_QUAL_COLUMN_CONFIG = {
+    'qualification': st.column_config.TextColumn("Qualification"),
+    'institution': st.column_config.TextColumn("Institution"),
+    'year': st.column_config.TextColumn("Year"),
+    'grade': st.column_config.TextColumn("Grade")
+}
+_SKILL_COLUMN_CONFIG = {
+    'skill': st.column_config.TextColumn("Skill"),
+    'proficiency': st.column_config.NumberColumn("Level", min_value=1, max_value=5, step=1, default=3)
+}
+
+def _editor_records(df):
+    """Rows of a data_editor frame as dicts, with blank cells as empty strings"""
+    return df.astype(object).where(df.notna(), '').to_dict('records')
+
+def _table_editor(rows, key, columns=None, column_config=None, text_column=None):
+    """One st.data_editor for a list of dict rows (or of strings, via text_column), edited in place"""
+    import pandas as pd
+    
+    # Submitted edits are written back into the list; the widget key then moves on so the
+    # next run starts a fresh editor from the updated list instead of re-applying the same edits
+    revisions = st.session_state.setdefault('table_editor_revisions', {})
+    editor_key = f"{key}_{st.session_state.get('table_editor_generation', 0)}_{revisions.get(key, 0)}"
+    
+    if text_column:
+        frame = pd.DataFrame({text_column: rows}, columns=[text_column])
+    else:
+        frame = pd.DataFrame(rows, columns=columns)
+    edited = st.data_editor(
+        frame,
+        num_rows="dynamic",
+        hide_index=True,
+        use_container_width=True,
+        key=editor_key,
+        column_config=column_config
+    )
+    
+    if any(st.session_state.get(editor_key, {}).values()):
+        records = _editor_records(edited)
+        rows[:] = [row[text_column] for row in records] if text_column else records
+        revisions[key] = revisions.get(key, 0) + 1
+    return rows
+
+# Row callbacks run before the rerun a button click already triggers, so no st.rerun() is needed
+def _add_row(rows, row):
+    """Append a blank row to a form list"""
+    rows.append(row)
+
+def _delete_uid_row(rows, uid):
+    """Remove the row with the given widget id from a form list"""
+    rows[:] = [row for row in rows if row.get('_uid') != uid]
+
+def _row_uid(item):
+    """Stable widget-key id for a list row, so deleting a row does not shift the others' state"""
+    return item.setdefault('_uid', uuid.uuid4().hex)
+
+def _without_uid(item):
+    """Copy of a list row without its UI-only widget id"""
+    return {k: v for k, v in item.items() if k != '_uid'}
+
 def show_candidate_form():
     if st.session_state.manual_entry_mode:
         st.markdown('<div class="section-header"><h2>📝 Enter Candidate Information</h2></div>', unsafe_allow_html=True)
-        st.markdown('<p style="color: #64748b; font-style: italic;">Please enter the candidate information manually and save to the database.</p>', unsafe_allow_html=True)
+        st.markdown('<p class="form-hint">Please enter the candidate information manually and save to the database.</p>', unsafe_allow_html=True)
     else:
         st.markdown('<div class="section-header"><h2>📝 Review and Edit Candidate Information</h2></div>', unsafe_allow_html=True)
-        st.markdown('<p style="color: #64748b; font-style: italic;">Please review the extracted information and make any necessary corrections before saving.</p>', unsafe_allow_html=True)
+        st.markdown('<p class="form-hint">Please review the extracted information and make any necessary corrections before saving.</p>', unsafe_allow_html=True)
     
     # Handle overwrite confirmation dialog
     if st.session_state.show_overwrite_dialog:
         show_overwrite_confirmation_dialog()
         return
     
-    # Personal Information Section
-    st.markdown('<div class="form-section">', unsafe_allow_html=True)
-    st.markdown("### 👤 Personal Information")
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.session_state.form_name = st.text_input(
-            "Full Name *", 
-            value=st.session_state.form_name, 
-            key="name_input",
-            help="Full name of the candidate"
-        )
-        st.session_state.form_email = st.text_input(
-            "Email Address *", 
-            value=st.session_state.form_email, 
-            key="email_input",
-            help="Primary email address"
-        )
-        st.session_state.form_phone = st.text_input(
-            "Phone Number", 
-            value=st.session_state.form_phone, 
-            key="phone_input",
-            help="Contact phone number with country code"
-        )
-        
-    with col2:
-        st.session_state.form_current_role = st.text_input(
-            "Current Role", 
-            value=st.session_state.form_current_role, 
-            key="role_input",
-            help="Current job title or position"
-        )
-        st.session_state.form_industry = st.text_input(
-            "Industry", 
-            value=st.session_state.form_industry, 
-            key="industry_input",
-            help="Industry or sector"
-        )
-        st.session_state.form_notice_period = st.text_input(
-            "Notice Period", 
-            value=st.session_state.form_notice_period, 
-            key="notice_input",
-            help="Notice period required (e.g., '4 weeks', '1 month')"
-        )
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Salary Information
-    st.markdown('<div class="form-section">', unsafe_allow_html=True)
-    st.markdown("### 💰 Salary Information")
-    col3, col4 = st.columns(2)
-    with col3:
-        st.session_state.form_current_salary = st.text_input(
-            "Current Salary", 
-            value=st.session_state.form_current_salary, 
-            key="current_sal",
-            help="Current salary amount and currency"
-        )
-    with col4:
-        st.session_state.form_desired_salary = st.text_input(
-            "Desired Salary", 
-            value=st.session_state.form_desired_salary, 
-            key="desired_sal",
-            help="Expected or desired salary"
-        )
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Education
-    st.markdown('<div class="form-section">', unsafe_allow_html=True)
-    st.markdown("### 🎓 Education")
-    st.session_state.form_highest_qualification = st.text_input(
-        "Highest Qualification", 
-        value=st.session_state.form_highest_qualification, 
-        key="highest_qual",
-        help="Highest educational qualification achieved"
-    )
-    
-    # Enhanced Qualifications Section
-    st.markdown("**📚 Detailed Qualifications:**")
-    
-    if not st.session_state.qualifications_list:
-        st.info("💡 No qualifications extracted. Click 'Add Qualification' to add educational background.")
-    
-    # Display existing qualifications
-    for i, qual in enumerate(st.session_state.qualifications_list):
-        with st.container():
-            st.markdown(f"**Qualification {i+1}:**")
-            col_qual1, col_qual2, col_qual3, col_qual4 = st.columns([3, 3, 2, 1])
-            with col_qual1:
-                qual['qualification'] = st.text_input(
-                    f"Qualification {i+1}", 
-                    value=qual.get('qualification', ''),
-                    key=f"qual_{i}"
+    _candidate_form()
+
+@st.fragment
+def _candidate_form():
+    """Candidate form; adding or deleting a position reruns only this fragment, not the whole page"""
+    # Batch every field into one form so edits only rerun the script on submit
+    with st.form("candidate_form", clear_on_submit=False):
+        # Personal Information Section
+        with st.container(border=True):
+            st.markdown("### 👤 Personal Information")
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.session_state.form_name = st.text_input(
+                    "Full Name *", 
+                    value=st.session_state.form_name, 
+                    key="name_input",
+                    help="Full name of the candidate"
                 )
-            with col_qual2:
-                qual['institution'] = st.text_input(
-                    f"Institution {i+1}", 
-                    value=qual.get('institution', ''),
-                    key=f"inst_{i}",
+                st.session_state.form_email = st.text_input(
+                    "Email Address *", 
+                    value=st.session_state.form_email, 
+                    key="email_input",
+                    help="Primary email address"
                 )
-            with col_qual3:
-                qual['year'] = st.text_input(
-                    f"Year {i+1}", 
-                    value=qual.get('year', ''),
-                    key=f"year_{i}",
+                st.session_state.form_phone = st.text_input(
+                    "Phone Number", 
+                    value=st.session_state.form_phone, 
+                    key="phone_input",
+                    help="Contact phone number with country code"
                 )
-            with col_qual4:
-                if st.button("🗑️", key=f"del_qual_{i}", help="Delete qualification"):
-                    st.session_state.qualifications_list.pop(i)
-                    st.rerun()
-    
-    if st.button("➕ Add Qualification", key="add_qualification_btn"):
-        st.session_state.qualifications_list.append({'qualification': '', 'institution': '', 'year': '', 'grade': ''})
-        st.rerun()
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Enhanced Skills Section
-    st.markdown('<div class="form-section">', unsafe_allow_html=True)
-    st.markdown("### 🛠️ Skills")
-    
-    if not st.session_state.skills_list:
-        st.info("💡 No skills extracted. Click 'Add Skill' to add technical and soft skills.")
-    
-    # Display skills with NO REFRESH
-    for i, skill in enumerate(st.session_state.skills_list):
-        with st.container():
-            st.markdown(f"**Skill {i+1}:**")
-            col_skill1, col_skill2, col_skill3 = st.columns([4, 2, 1])
-            with col_skill1:
-                skill['skill'] = st.text_input(
-                    f"Skill {i+1}", 
-                    value=skill.get('skill', ''),
-                    key=f"skill_{i}",
-                    label_visibility="collapsed"
+                
+            with col2:
+                st.session_state.form_current_role = st.text_input(
+                    "Current Role", 
+                    value=st.session_state.form_current_role, 
+                    key="role_input",
+                    help="Current job title or position"
                 )
-            with col_skill2:
-                skill['proficiency'] = st.selectbox(
-                    f"Level {i+1}",
-                    options=[1, 2, 3, 4, 5],
-                    index=min(skill.get('proficiency', 3) - 1, 4),
-                    format_func=lambda x: f"{x} - {'Beginner' if x==1 else 'Basic' if x==2 else 'Intermediate' if x==3 else 'Advanced' if x==4 else 'Expert'}",
-                    key=f"prof_{i}",
-                    label_visibility="collapsed"
+                st.session_state.form_industry = st.text_input(
+                    "Industry", 
+                    value=st.session_state.form_industry, 
+                    key="industry_input",
+                    help="Industry or sector"
                 )
-            with col_skill3:
-                if st.button("🗑️", key=f"del_skill_{i}", help="Delete skill"):
-                    st.session_state.skills_list.pop(i)
-                    st.rerun()
-    
-    if st.button("➕ Add Skill", key="add_skill_btn"):
-        st.session_state.skills_list.append({'skill': '', 'proficiency': 3})
-        st.rerun()
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Enhanced Experience Section
-    show_enhanced_experience_section()
-    
-    # Enhanced Achievements Section
-    st.markdown('<div class="form-section">', unsafe_allow_html=True)
-    st.markdown("### 🏆 Achievements")
-    
-    if not st.session_state.achievements_list:
-        st.info("💡 No achievements extracted. Click 'Add Achievement' to add accomplishments and awards.")
-    
-    for i, achievement in enumerate(st.session_state.achievements_list):
-        with st.container():
-            st.markdown(f"**Achievement {i+1}:**")
-            col_ach1, col_ach2 = st.columns([5, 1])
-            with col_ach1:
-                st.session_state.achievements_list[i] = st.text_area(
-                    f"Achievement {i+1}", 
-                    value=achievement,
-                    height=68,
-                    key=f"ach_{i}",
-                    label_visibility="collapsed"
+                st.session_state.form_notice_period = st.text_input(
+                    "Notice Period", 
+                    value=st.session_state.form_notice_period, 
+                    key="notice_input",
+                    help="Notice period required (e.g., '4 weeks', '1 month')"
                 )
-            with col_ach2:
-                st.write("")  # Empty space for alignment
-                if st.button("🗑️", key=f"del_ach_{i}", help="Delete achievement"):
-                    st.session_state.achievements_list.pop(i)
-                    st.rerun()
-    
-    if st.button("➕ Add Achievement", key="add_achievement_btn"):
-        st.session_state.achievements_list.append('')
-        st.rerun()
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Special Skills
-    st.markdown('<div class="form-section">', unsafe_allow_html=True)
-    st.markdown("### ⭐ Special Skills & Certifications")
-    st.session_state.form_special_skills = st.text_area(
-        "Special Skills", 
-        value=st.session_state.form_special_skills, 
-        height=100, 
-        key="special_skills_input",
-        help="Additional skills, certifications, languages, or unique abilities"
-    )
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Comments Section - ADD THIS SECTION
-    st.markdown('<div class="form-section">', unsafe_allow_html=True)
-    st.markdown("### 📝 Comments & Notes")
-    st.session_state.form_comments = st.text_area(
-        "Comments", 
-        value=st.session_state.form_comments if hasattr(st.session_state, 'form_comments') else "",
-        height=120, 
-        key="form_comments_input",
-        help="Add any additional notes, comments, or observations about this candidate",
-        placeholder="Enter any additional notes about the candidate, interview feedback, cultural fit observations, etc."
-    )
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Form submission with enhanced styling
-    st.markdown("---")
-    st.markdown('<div class="professional-spacing">', unsafe_allow_html=True)
-    col_submit1, col_submit2 = st.columns([3, 1])
-    with col_submit1:
-        st.markdown("*Fields marked with * are required")
-    with col_submit2:
-        if st.button("💾 Save to Database", type="primary", use_container_width=True, key="save_candidate_btn"):
-            if st.session_state.form_name and st.session_state.form_email:  # Basic validation
-                handle_candidate_save()
-            else:
-                st.markdown('<div class="error-message">❌ Please fill in at least Name and Email fields.</div>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+        
+        # Salary Information
+        with st.container(border=True):
+            st.markdown("### 💰 Salary Information")
+            col3, col4 = st.columns(2)
+            with col3:
+                st.session_state.form_current_salary = st.text_input(
+                    "Current Salary", 
+                    value=st.session_state.form_current_salary, 
+                    key="current_sal",
+                    help="Current salary amount and currency"
+                )
+            with col4:
+                st.session_state.form_desired_salary = st.text_input(
+                    "Desired Salary", 
+                    value=st.session_state.form_desired_salary, 
+                    key="desired_sal",
+                    help="Expected or desired salary"
+                )
+        
+        # Education
+        with st.container(border=True):
+            st.markdown("### 🎓 Education")
+            st.session_state.form_highest_qualification = st.text_input(
+                "Highest Qualification", 
+                value=st.session_state.form_highest_qualification, 
+                key="highest_qual",
+                help="Highest educational qualification achieved"
+            )
+            
+            # Enhanced Qualifications Section
+            st.markdown("**📚 Detailed Qualifications:**")
+            st.caption("Add or remove rows with the table controls.")
+            
+            _table_editor(st.session_state.qualifications_list, "qual_editor", _QUAL_COLUMNS, _QUAL_COLUMN_CONFIG)
+        
+        # Enhanced Skills Section
+        with st.container(border=True):
+            st.markdown("### 🛠️ Skills")
+            st.caption("Proficiency: " + ", ".join(_PROF_LABELS))
+            
+            _table_editor(st.session_state.skills_list, "skills_editor", _SKILL_COLUMNS, _SKILL_COLUMN_CONFIG)
+        
+        # Enhanced Experience Section
+        show_enhanced_experience_section(in_form=True)
+        
+        # Enhanced Achievements Section
+        with st.container(border=True):
+            st.markdown("### 🏆 Achievements")
+            st.caption("Add or remove rows with the table controls.")
+            
+            _table_editor(st.session_state.achievements_list, "ach_editor", text_column='achievement',
+                          column_config={'achievement': st.column_config.TextColumn("Achievement", width="large")})
+        
+        # Special Skills
+        with st.container(border=True):
+            st.markdown("### ⭐ Special Skills & Certifications")
+            st.session_state.form_special_skills = st.text_area(
+                "Special Skills", 
+                value=st.session_state.form_special_skills, 
+                height=100, 
+                key="special_skills_input",
+                help="Additional skills, certifications, languages, or unique abilities"
+            )
+        
+        # Comments Section - ADD THIS SECTION
+        with st.container(border=True):
+            st.markdown("### 📝 Comments & Notes")
+            st.session_state.form_comments = st.text_area(
+                "Comments", 
+                value=st.session_state.form_comments if hasattr(st.session_state, 'form_comments') else "",
+                height=120, 
+                key="form_comments_input",
+                help="Add any additional notes, comments, or observations about this candidate",
+                placeholder="Enter any additional notes about the candidate, interview feedback, cultural fit observations, etc."
+            )
+        
+        # Form submission with enhanced styling
+        st.markdown("---")
+        col_submit1, col_submit2 = st.columns([3, 1])
+        with col_submit1:
+            st.markdown("*Fields marked with * are required")
+        with col_submit2:
+            if st.form_submit_button("💾 Save to Database", type="primary", use_container_width=True, key="save_candidate_btn"):
+                if st.session_state.form_name and st.session_state.form_email:  # Basic validation
+                    handle_candidate_save(
+                        st.session_state.qualifications_list,
+                        st.session_state.skills_list,
+                        st.session_state.achievements_list
+                    )
+                else:
+                    st.markdown('<div class="error-message">❌ Please fill in at least Name and Email fields.</div>', unsafe_allow_html=True)
 
-def show_enhanced_experience_section(prefix=""):
+def show_enhanced_experience_section(prefix="", in_form=False):
     """Display enhanced work experience section with bullet points"""
-    st.markdown('<div class="form-section">', unsafe_allow_html=True)
-    st.markdown("### 💼 Work Experience")
+    # Inside st.form only submit buttons are allowed
+    button = st.form_submit_button if in_form else st.button
     
-    # Determine which experience list to use
-    if prefix == "edit":
-        experience_list = st.session_state.edit_experience_list
-    else:
-        experience_list = st.session_state.experience_list
-    
-    if not experience_list:
-        st.info("💡 No work experience extracted. Click 'Add Work Experience' to add employment history.")
-    
-    # Display experience in expandable sections
-    for i, exp in enumerate(experience_list):
-        position_title = exp.get('position', 'New Position')
-        company_name = exp.get('company', '')
-        display_title = f"Position {i+1}: {position_title}"
-        if company_name:
-            display_title += f" at {company_name}"
-            
-        with st.expander(display_title, expanded=True if i == 0 else False):
-            # Basic information in columns
-            col_exp1, col_exp2 = st.columns(2)
-            with col_exp1:
-                exp['position'] = st.text_input(
-                    "Job Title", 
-                    value=exp.get('position', ''),
-                    key=f"{prefix}pos_{i}"
-                )
-                exp['company'] = st.text_input(
-                    "Company", 
-                    value=exp.get('company', ''),
-                    key=f"{prefix}comp_{i}"
-                )
-                exp['years'] = st.text_input(
-                    "Duration", 
-                    value=exp.get('years', ''),
-                    key=f"{prefix}duration_{i}",
-                    help="e.g., '2020-2023', '3 years', 'Jan 2020 - Present'"
-                )
-                
-            with col_exp2:
-                exp['location'] = st.text_input(
-                    "Location", 
-                    value=exp.get('location', ''),
-                    key=f"{prefix}location_{i}"
-                )
-                exp['employment_type'] = st.selectbox(
-                    "Employment Type",
-                    options=['', 'Full-time', 'Part-time', 'Contract', 'Internship', 'Freelance', 'Consultant'],
-                    index=0 if not exp.get('employment_type') else 
-                          ['', 'Full-time', 'Part-time', 'Contract', 'Internship', 'Freelance', 'Consultant'].index(exp.get('employment_type')) 
-                          if exp.get('employment_type') in ['', 'Full-time', 'Part-time', 'Contract', 'Internship', 'Freelance', 'Consultant'] else 0,
-                    key=f"{prefix}emp_type_{i}"
-                )
+    with st.container(border=True):
+        st.markdown("### 💼 Work Experience")
+        
+        # Determine which experience list to use
+        if prefix == "edit":
+            experience_list = st.session_state.edit_experience_list
+        else:
+            experience_list = st.session_state.experience_list
+        
+        if not experience_list:
+            st.info("💡 No work experience extracted. Click 'Add Work Experience' to add employment history.")
+        
+        # Display experience in expandable sections
+        for i, exp in enumerate(experience_list):
+            uid = _row_uid(exp)
+            position_title = exp.get('position', 'New Position')
+            company_name = exp.get('company', '')
+            display_title = f"Position {i+1}: {position_title}"
+            if company_name:
+                display_title += f" at {company_name}"
                 
-                # Additional details in a single row
-                col_team, col_reporting = st.columns(2)
-                with col_team:
-                    exp['team_size'] = st.text_input(
-                        "Team Size", 
-                        value=exp.get('team_size', ''),
-                        key=f"{prefix}team_size_{i}"
+            with st.expander(display_title, expanded=True if i == 0 else False):
+                # Basic information in columns
+                col_exp1, col_exp2 = st.columns(2)
+                with col_exp1:
+                    exp['position'] = st.text_input(
+                        "Job Title", 
+                        value=exp.get('position', ''),
+                        key=f"{prefix}pos_{uid}"
                     )
-                with col_reporting:
-                    exp['reporting_to'] = st.text_input(
-                        "Reporting To", 
-                        value=exp.get('reporting_to', ''),
-                        key=f"{prefix}reporting_{i}"
+                    exp['company'] = st.text_input(
+                        "Company", 
+                        value=exp.get('company', ''),
+                        key=f"{prefix}comp_{uid}"
                     )
-            
-            # Responsibilities Section
-            st.markdown("**📋 Key Responsibilities:**")
-            responsibilities = exp.get('responsibilities', [])
-            
-            if not responsibilities:
-                exp['responsibilities'] = ['']
-                responsibilities = exp['responsibilities']
-            
-            # Display responsibilities with bullet point styling
-            for j, resp in enumerate(responsibilities):
-                col_resp1, col_resp2 = st.columns([5, 1])
-                with col_resp1:
-                    responsibilities[j] = st.text_area(
-                        f"Responsibility {j+1}", 
-                        value=resp,
-                        height=70,
-                        key=f"{prefix}resp_{i}_{j}",
-                        help="Enter a specific responsibility or duty",
-                        label_visibility="collapsed"
+                    exp['years'] = st.text_input(
+                        "Duration", 
+                        value=exp.get('years', ''),
+                        key=f"{prefix}duration_{uid}",
+                        help="e.g., '2020-2023', '3 years', 'Jan 2020 - Present'"
                     )
-                with col_resp2:
-                    st.write("")  # Spacing
-                    if st.button("🗑️", key=f"{prefix}del_resp_{i}_{j}", help="Delete responsibility"):
-                        responsibilities.pop(j)
-                        st.rerun()
-            
-            col_add_resp = st.columns(1)[0]
-            with col_add_resp:
-                if st.button(f"➕ Add Responsibility", key=f"{prefix}add_resp_{i}"):
-                    responsibilities.append('')
-                    st.rerun()
-            
-            # Achievements Section
-            st.markdown("**🏆 Key Achievements:**")
-            achievements = exp.get('achievements', [])
-            
-            if not achievements:
-                exp['achievements'] = []
-                achievements = exp['achievements']
-            
-            for j, achievement in enumerate(achievements):
-                col_ach1, col_ach2 = st.columns([5, 1])
-                with col_ach1:
-                    achievements[j] = st.text_area(
-                        f"Achievement {j+1}", 
-                        value=achievement,
-                        height=70,
-                        key=f"{prefix}ach_{i}_{j}",
-                        help="Enter a specific achievement, award, or measurable result",
-                        label_visibility="collapsed"
+                    
+                with col_exp2:
+                    exp['location'] = st.text_input(
+                        "Location", 
+                        value=exp.get('location', ''),
+                        key=f"{prefix}location_{uid}"
                     )
-                with col_ach2:
-                    st.write("")  # Spacing
-                    if st.button("🗑️", key=f"{prefix}del_ach_{i}_{j}", help="Delete achievement"):
-                        achievements.pop(j)
-                        st.rerun()
-            
-            col_add_ach = st.columns(1)[0]
-            with col_add_ach:
-                if st.button(f"➕ Add Achievement", key=f"{prefix}add_ach_{i}"):
-                    achievements.append('')
-                    st.rerun()
-            
-            # Technologies Section
-            st.markdown("**💻 Technologies & Tools:**")
-            technologies = exp.get('technologies', [])
-            
-            if not technologies:
-                exp['technologies'] = []
-                technologies = exp['technologies']
-            
-            for j, tech in enumerate(technologies):
-                col_tech1, col_tech2 = st.columns([5, 1])
-                with col_tech1:
-                    technologies[j] = st.text_input(
-                        f"Technology {j+1}", 
-                        value=tech,
-                        key=f"{prefix}tech_{i}_{j}",
-                        help="Enter a technology, tool, or software used",
-                        label_visibility="collapsed"
+                    exp['employment_type'] = st.selectbox(
+                        "Employment Type",
+                        options=['', 'Full-time', 'Part-time', 'Contract', 'Internship', 'Freelance', 'Consultant'],
+                        index=0 if not exp.get('employment_type') else 
+                              ['', 'Full-time', 'Part-time', 'Contract', 'Internship', 'Freelance', 'Consultant'].index(exp.get('employment_type')) 
+                              if exp.get('employment_type') in ['', 'Full-time', 'Part-time', 'Contract', 'Internship', 'Freelance', 'Consultant'] else 0,
+                        key=f"{prefix}emp_type_{uid}"
                     )
-                with col_tech2:
-                    if st.button("🗑️", key=f"{prefix}del_tech_{i}_{j}", help="Delete technology"):
-                        technologies.pop(j)
-                        st.rerun()
-            
-            col_add_tech = st.columns(1)[0]
-            with col_add_tech:
-                if st.button(f"➕ Add Technology", key=f"{prefix}add_tech_{i}"):
-                    technologies.append('')
-                    st.rerun()
-            
-            # Delete position button
-            st.markdown("---")
-            col_del_exp = st.columns(1)[0]
-            with col_del_exp:
-                if st.button(f"🗑️ Delete Position", key=f"{prefix}del_exp_{i}", type="secondary"):
-                    experience_list.pop(i)
-                    st.rerun()
-    
-    # Add new experience button
-    if st.button("➕ Add Work Experience", key=f"{prefix}add_experience_btn"):
+                    
+                    # Additional details in a single row
+                    col_team, col_reporting = st.columns(2)
+                    with col_team:
+                        exp['team_size'] = st.text_input(
+                            "Team Size", 
+                            value=exp.get('team_size', ''),
+                            key=f"{prefix}team_size_{uid}"
+                        )
+                    with col_reporting:
+                        exp['reporting_to'] = st.text_input(
+                            "Reporting To", 
+                            value=exp.get('reporting_to', ''),
+                            key=f"{prefix}reporting_{uid}"
+                        )
+                
+                # Responsibilities, achievements and technologies: one table each instead of a widget per row
+                st.markdown("**📋 Key Responsibilities:**")
+                _table_editor(exp.setdefault('responsibilities', []), f"{prefix}resp_editor_{uid}", text_column='responsibility',
+                              column_config={'responsibility': st.column_config.TextColumn("Responsibility", width="large")})
+                
+                st.markdown("**🏆 Key Achievements:**")
+                _table_editor(exp.setdefault('achievements', []), f"{prefix}ach_editor_{uid}", text_column='achievement',
+                              column_config={'achievement': st.column_config.TextColumn("Achievement", width="large")})
+                
+                st.markdown("**💻 Technologies & Tools:**")
+                _table_editor(exp.setdefault('technologies', []), f"{prefix}tech_editor_{uid}", text_column='technology',
+                              column_config={'technology': st.column_config.TextColumn("Technology")})
+                
+                # Delete position button
+                st.markdown("---")
+                col_del_exp = st.columns(1)[0]
+                with col_del_exp:
+                    button(f"🗑️ Delete Position", key=f"{prefix}del_exp_{uid}", type="secondary",
+                           on_click=_delete_uid_row, args=(experience_list, uid))
+        
+        # Add new experience button
         new_experience = {
             'position': '', 
             'company': '', 
@@ -683,72 +672,113 @@ def show_enhanced_experience_section(prefix=""):
             'achievements': [],
             'technologies': []
         }
-        experience_list.append(new_experience)
-        st.rerun()
-        
-    st.markdown('</div>', unsafe_allow_html=True)
+        button("➕ Add Work Experience", key=f"{prefix}add_experience_btn",
+               on_click=_add_row, args=(experience_list, new_experience))
+            
+
+def _build_candidate_payload(qualifications, skills, achievements):
+    """Build the candidate record from the form state without mutating session state"""
+    ss = st.session_state
+    clean_experience = [
+        {
+            **_without_uid(exp),
+            'responsibilities': [r.strip() for r in exp.get('responsibilities', []) if r and r.strip()],
+            'achievements': [a.strip() for a in exp.get('achievements', []) if a and a.strip()],
+            'technologies': [t.strip() for t in exp.get('technologies', []) if t and t.strip()]
+        }
+        for exp in ss.experience_list
+        if exp.get('position') or exp.get('company')
+    ]
+    
+    return {
+        'name': ss.form_name.strip(),
+        'current_role': ss.form_current_role.strip(),
+        'email': ss.form_email.strip(),
+        'phone': ss.form_phone.strip(),
+        'notice_period': ss.form_notice_period.strip(),
+        'current_salary': ss.form_current_salary.strip(),
+        'industry': ss.form_industry.strip(),
+        'desired_salary': ss.form_desired_salary.strip(),
+        'highest_qualification': ss.form_highest_qualification.strip(),
+        'experience': clean_experience,
+        'skills': [
+            {'skill': str(s['skill']).strip(), 'proficiency': int(s.get('proficiency') or 3)}
+            for s in skills if str(s.get('skill', '')).strip()
+        ],
+        'qualifications': [
+            {k: str(v) for k, v in q.items()}
+            for q in qualifications if str(q.get('qualification', '')).strip()
+        ],
+        'achievements': [str(a).strip() for a in achievements if str(a).strip()],
+        'special_skills': ss.form_special_skills.strip(),
+        'comments': ss.get('form_comments', '').strip()
+    }
+
+def _build_edit_payload():
+    """Build the candidate record from the edit page state without mutating session state"""
+    # Clean up empty entries
+    clean_qualifications = [_without_uid(q) for q in st.session_state.edit_qualifications_list if q.get('qualification')]
+    clean_skills = [
+        {'skill': s['skill'], 'proficiency': int(s.get('proficiency') or 3)}
+        for s in st.session_state.edit_skills_list if s.get('skill')
+    ]
+    clean_experience = []
+    
+    for exp in st.session_state.edit_experience_list:
+        if exp.get('position') or exp.get('company'):
+            clean_resp = [r for r in exp.get('responsibilities', []) if r.strip()]
+            clean_ach = [a for a in exp.get('achievements', []) if a.strip()]
+            clean_tech = [t for t in exp.get('technologies', []) if t.strip()]
+            
+            cleaned_exp = _without_uid(exp)
+            cleaned_exp['responsibilities'] = clean_resp
+            cleaned_exp['achievements'] = clean_ach
+            cleaned_exp['technologies'] = clean_tech
+            clean_experience.append(cleaned_exp)
+    
+    clean_achievements = [a for a in st.session_state.edit_achievements_list if a.strip()]
+    
+    return {
+        'name': st.session_state.edit_name,
+        'current_role': st.session_state.edit_current_role,
+        'email': st.session_state.edit_email,
+        'phone': st.session_state.edit_phone,
+        'notice_period': st.session_state.edit_notice_period,
+        'current_salary': st.session_state.edit_current_salary,
+        'industry': st.session_state.edit_industry,
+        'desired_salary': st.session_state.edit_desired_salary,
+        'highest_qualification': st.session_state.edit_highest_qualification,
+        'experience': clean_experience,
+        'skills': clean_skills,
+        'qualifications': clean_qualifications,
+        'achievements': clean_achievements,
+        'special_skills': st.session_state.edit_special_skills,
+        'comments': st.session_state.edit_comments  # New comments field
+    }
+
+def _payload_fingerprint(payload):
+    """Digest of a candidate payload, used to skip updates that change nothing"""
+    return hashlib.blake2b(json.dumps(payload, sort_keys=True, default=str).encode(), digest_size=16).hexdigest()
 
-def handle_candidate_save():
+def handle_candidate_save(qualifications, skills, achievements):
     """Handle the candidate save process with overwrite logic and FORCED cloud sync"""
     try:
-        # Clean up empty entries more thoroughly
-        clean_qualifications = []
-        for q in st.session_state.qualifications_list:
-            if q.get('qualification') and q.get('qualification').strip():
-                clean_qualifications.append(q)
-        
-        clean_skills = []
-        for s in st.session_state.skills_list:
-            if s.get('skill') and s.get('skill').strip():
-                clean_skills.append(s)
-        
-        clean_experience = []
-        for exp in st.session_state.experience_list:
-            if exp.get('position') or exp.get('company'):
-                # Clean up empty arrays
-                clean_resp = [r.strip() for r in exp.get('responsibilities', []) if r and r.strip()]
-                clean_ach = [a.strip() for a in exp.get('achievements', []) if a and a.strip()]
-                clean_tech = [t.strip() for t in exp.get('technologies', []) if t and t.strip()]
-                
-                cleaned_exp = exp.copy()
-                cleaned_exp['responsibilities'] = clean_resp
-                cleaned_exp['achievements'] = clean_ach
-                cleaned_exp['technologies'] = clean_tech
-                clean_experience.append(cleaned_exp)
-        
-        clean_achievements = [a.strip() for a in st.session_state.achievements_list if a and a.strip()]
-        
-        candidate_data = {
-            'name': st.session_state.form_name.strip(),
-            'current_role': st.session_state.form_current_role.strip(),
-            'email': st.session_state.form_email.strip(),
-            'phone': st.session_state.form_phone.strip(),
-            'notice_period': st.session_state.form_notice_period.strip(),
-            'current_salary': st.session_state.form_current_salary.strip(),
-            'industry': st.session_state.form_industry.strip(),
-            'desired_salary': st.session_state.form_desired_salary.strip(),
-            'highest_qualification': st.session_state.form_highest_qualification.strip(),
-            'experience': clean_experience,
-            'skills': clean_skills,
-            'qualifications': clean_qualifications,
-            'achievements': clean_achievements,
-            'special_skills': st.session_state.form_special_skills.strip(),
-            'comments': st.session_state.form_comments.strip() if hasattr(st.session_state, 'form_comments') else ''  # Add comments field
-        }
+        candidate_data = _build_candidate_payload(qualifications, skills, achievements)
         
         # Check if candidate already exists
-        existing_candidate = st.session_state.db_manager.get_candidate_by_email(st.session_state.form_email.strip())
+        existing_candidate = lookup_existing_candidate(st.session_state.form_email.strip())
         
         if existing_candidate:
             # Store the candidate data for potential overwrite
-            st.session_state.pending_candidate_data = candidate_data
+            # Detached copy: the payload's experience rows are only shallow copies of the form rows
+            st.session_state.pending_candidate_data = copy.deepcopy(candidate_data)
             st.session_state.existing_candidate_email = st.session_state.form_email.strip()
             st.session_state.show_overwrite_dialog = True
             st.rerun()
         else:
             # New candidate, proceed with insert (includes FORCED cloud sync)
             try:
-                db_result = st.session_state.db_manager.insert_candidate(candidate_data)
+                db_result = get_db_manager().insert_candidate(candidate_data)
                 
                 # Handle both tuple and boolean returns for backward compatibility
                 if isinstance(db_result, tuple):
@@ -766,6 +796,7 @@ def handle_candidate_save():
                     # CRITICAL: Additional sync confirmation
                     import logging
                     logging.info("✅ Candidate save completed with forced cloud sync")
+                    clear_candidate_caches()
                     
                     clear_form_session_state()
                     st.rerun()
@@ -799,10 +830,12 @@ def show_save_summary(candidate_data):
 
 def show_overwrite_confirmation_dialog():
     """Show the overwrite confirmation dialog"""
-    st.markdown('<div class="warning-message">', unsafe_allow_html=True)
-    st.markdown("### ⚠️ Candidate Already Exists")
-    st.markdown(f"A candidate with email **{st.session_state.existing_candidate_email}** already exists in the database.")
-    st.markdown("</div>", unsafe_allow_html=True)
+    email = html.escape(str(st.session_state.existing_candidate_email))
+    st.markdown(
+        '<div class="warning-message"><h3>⚠️ Candidate Already Exists</h3>'
+        f'<p>A candidate with email <strong>{email}</strong> already exists in the database.</p></div>',
+        unsafe_allow_html=True
+    )
     
     st.markdown("**What would you like to do?**")
     
@@ -812,7 +845,7 @@ def show_overwrite_confirmation_dialog():
         if st.button("✅ Overwrite Record", type="primary", use_container_width=True, key="overwrite_btn"):
             # Update the existing candidate (includes FORCED cloud sync)
             try:
-                result, message = st.session_state.db_manager.update_candidate(st.session_state.pending_candidate_data)
+                result, message = get_db_manager().update_candidate(st.session_state.pending_candidate_data)
                 
                 if result:
                     st.markdown('<div class="success-message">✅ Candidate record updated successfully and synced to cloud!</div>', unsafe_allow_html=True)
@@ -820,6 +853,7 @@ def show_overwrite_confirmation_dialog():
                     # CRITICAL: Additional sync confirmation
                     import logging
                     logging.info("✅ Candidate overwrite completed with forced cloud sync")
+                    clear_candidate_caches()
                     
                     clear_form_session_state()
                     clear_overwrite_dialog_state()
@@ -835,10 +869,8 @@ def show_overwrite_confirmation_dialog():
                 st.rerun()
     
     with col2:
-        if st.button("❌ Cancel", use_container_width=True, key="cancel_overwrite_btn"):
-            clear_overwrite_dialog_state()
-            st.markdown('<div class="warning-message">ℹ️ The candidate already exists. Please modify the email address or update the existing record.</div>', unsafe_allow_html=True)
-            st.rerun()
+        st.button("❌ Cancel", use_container_width=True, key="cancel_overwrite_btn",
+                  on_click=clear_overwrite_dialog_state)
     
     with col3:
         st.markdown("*Choose 'Overwrite' to update the existing record with new data, or 'Cancel' to return to the form.*")
\ No newline at end of file
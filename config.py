@@ -18,6 +18,7 @@ class Config:
     # Database sync settings
     AUTO_SYNC_ENABLED: bool = os.environ.get('AUTO_SYNC_ENABLED', 'True').lower() == 'true'
     SYNC_INTERVAL_SECONDS: int = int(os.environ.get('SYNC_INTERVAL_SECONDS', '300'))  # 5 minutes
+    DB_POOL_SIZE: int = int(os.environ.get('DB_POOL_SIZE', '10'))  # Max idle SQLite connections kept open
     
     # Azure Blob Storage Configuration
     AZURE_STORAGE_CONNECTION_STRING: Optional[str] = os.environ.get('AZURE_STORAGE_CONNECTION_STRING')
@@ -28,6 +29,7 @@ class Config:
     AZURE_OPENAI_API_KEY: Optional[str] = os.environ.get('AZURE_OPENAI_API_KEY')
     AZURE_OPENAI_API_VERSION: str = os.environ.get('AZURE_OPENAI_API_VERSION', '2024-02-15-preview')
     AZURE_OPENAI_DEPLOYMENT_NAME: str = os.environ.get('AZURE_OPENAI_DEPLOYMENT_NAME', 'gpt-4o-mini')
+    EXTRACTION_CACHE_DIR: str = os.environ.get('EXTRACTION_CACHE_DIR', '')  # Opt-in on-disk cache of extracted CVs; empty disables it
     
     # Authentication Configuration - NEW SECTION
     AZURE_AD_CLIENT_ID: Optional[str] = os.environ.get('AZURE_AD_CLIENT_ID')
@@ -47,6 +49,7 @@ class Config:
     # Backup Configuration
     AUTO_BACKUP_ENABLED: bool = os.environ.get('AUTO_BACKUP_ENABLED', 'True').lower() == 'true'
     BACKUP_RETENTION_DAYS: int = int(os.environ.get('BACKUP_RETENTION_DAYS', '30'))
+    BLOB_TRANSFER_CONCURRENCY: int = int(os.environ.get('BLOB_TRANSFER_CONCURRENCY', '4'))  # Parallel block transfers for large blobs
 
     # File Upload Configuration
     MAX_FILE_SIZE_MB: int = int(os.environ.get('MAX_FILE_SIZE_MB', '10'))
@@ -103,6 +106,7 @@ class Config:
             'local_db_path': cls.LOCAL_DB_PATH,
             'auto_sync_enabled': cls.AUTO_SYNC_ENABLED,
             'sync_interval_seconds': cls.SYNC_INTERVAL_SECONDS,
+            'db_pool_size': cls.DB_POOL_SIZE,
             'backup_container': cls.BACKUP_CONTAINER,
             'auto_backup_enabled': cls.AUTO_BACKUP_ENABLED,
             'backup_retention_days': cls.BACKUP_RETENTION_DAYS,
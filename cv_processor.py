@@ -1,11 +1,29 @@
 import pymupdf
+import hashlib
 import json
 import logging
+import os
 import re
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import Dict, List, Optional, Any
-from openai import AzureOpenAI
+from openai import AzureOpenAI, BadRequestError
 from config import Config
 
+# Bump when the extraction prompt or cleaning changes, so cached extractions are not reused
+EXTRACTION_PROMPT_VERSION = "2"
+# Cached extractions hold personal data, so they are kept only briefly and in bounded numbers
+EXTRACTION_CACHE_MAX_AGE_DAYS = 7
+EXTRACTION_CACHE_MAX_ENTRIES = 500
+
+# Upper bounds for one batched extraction call; the JSON for every CV has to fit in a single response
+BATCH_MAX_CVS = 5
+BATCH_MAX_CHARS = 60000
+# Sub-batches sent to OpenAI at the same time; kept low to stay inside the deployment's rate limit
+BATCH_CONCURRENCY = 3
+
 class CVProcessor:
     def __init__(self):
         self.client = None
@@ -28,24 +46,35 @@ class CVProcessor:
         """Extract text from PDF using PyMuPDF"""
         try:
             doc = pymupdf.open(pdf_path)
-            text = ""
-            
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                text += page.get_text()
-            
-            doc.close()
-            
-            # Clean up the text
-            text = self._clean_text(text)
-            
-            logging.info(f"Successfully extracted text from PDF: {len(text)} characters")
-            return text
+            return self._extract_text_from_document(doc)
             
         except Exception as e:
             logging.error(f"Error extracting text from PDF: {str(e)}")
             return None
     
+    def extract_text_from_pdf_bytes(self, pdf_bytes: bytes) -> Optional[str]:
+        """Extract text from in-memory PDF bytes using PyMuPDF (no temp file)"""
+        try:
+            doc = pymupdf.open(stream=pdf_bytes, filetype="pdf")
+            return self._extract_text_from_document(doc)
+            
+        except Exception as e:
+            logging.error(f"Error extracting text from PDF bytes: {str(e)}")
+            return None
+    
+    def _extract_text_from_document(self, doc) -> str:
+        """Read, close and clean the text of an opened PyMuPDF document"""
+        try:
+            text = "".join(doc.load_page(page_num).get_text() for page_num in range(len(doc)))
+        finally:
+            doc.close()
+        
+        # Clean up the text
+        text = self._clean_text(text)
+        
+        logging.info(f"Successfully extracted text from PDF: {len(text)} characters")
+        return text
+    
     def _clean_text(self, text: str) -> str:
         """Clean and normalize extracted text"""
         # Remove extra whitespace
@@ -59,8 +88,89 @@ class CVProcessor:
         
         return text.strip()
     
+    def _extraction_cache_path(self, cv_text: str) -> Optional[str]:
+        """On-disk cache file for a CV's extraction, addressed by the text, model and prompt version"""
+        if not Config.EXTRACTION_CACHE_DIR:
+            return None
+        data = cv_text.encode('utf-8')
+        key = hashlib.sha256(len(data).to_bytes(8, 'big') + data).hexdigest()
+        model = re.sub(r'[^\w.-]', '_', Config.AZURE_OPENAI_DEPLOYMENT_NAME)
+        return os.path.join(Config.EXTRACTION_CACHE_DIR, f"{model}_{EXTRACTION_PROMPT_VERSION}_{key}.json")
+    
+    def _load_cached_extraction(self, cache_path: str) -> Optional[Dict[str, Any]]:
+        """Read a cached extraction, re-validated so a stale or corrupt entry is never returned"""
+        try:
+            if time.time() - os.path.getmtime(cache_path) > EXTRACTION_CACHE_MAX_AGE_DAYS * 86400:
+                os.unlink(cache_path)
+                return None
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f).get('data')
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, AttributeError) as e:
+            logging.warning(f"Ignoring unreadable extraction cache entry {cache_path}: {str(e)}")
+            return None
+        
+        if not isinstance(data, dict) or not {'name', 'email', 'experience', 'skills'} <= data.keys():
+            logging.warning(f"Ignoring invalid extraction cache entry {cache_path}")
+            return None
+        return self._enhanced_validate_and_clean_data(data)
+    
+    def _store_cached_extraction(self, cache_path: str, data: Dict[str, Any]):
+        """Write an extraction to the on-disk cache; failures only cost a future API call"""
+        entry = {
+            'extracted_at': datetime.now().isoformat(),
+            'model': Config.AZURE_OPENAI_DEPLOYMENT_NAME,
+            'prompt_version': EXTRACTION_PROMPT_VERSION,
+            'data': data
+        }
+        tmp_path = None
+        try:
+            cache_dir = os.path.dirname(cache_path)
+            os.makedirs(cache_dir, exist_ok=True)
+            # A unique temp file per writer, so concurrent threads or sessions never share one
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logging.warning(f"Could not write extraction cache entry: {str(e)}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            return
+        self._prune_extraction_cache(cache_dir)
+    
+    def _prune_extraction_cache(self, cache_dir: str):
+        """Delete cache entries past the age limit, then the oldest ones beyond the entry limit"""
+        cutoff = time.time() - EXTRACTION_CACHE_MAX_AGE_DAYS * 86400
+        entries = []
+        try:
+            with os.scandir(cache_dir) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith(('.json', '.tmp')):
+                        entries.append((entry.stat().st_mtime, entry.path))
+        except OSError as e:
+            logging.warning(f"Could not scan extraction cache: {str(e)}")
+            return
+        
+        entries.sort(reverse=True)
+        for i, (mtime, path) in enumerate(entries):
+            if mtime < cutoff or i >= EXTRACTION_CACHE_MAX_ENTRIES:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+    
     def process_cv_with_openai(self, cv_text: str) -> Optional[Dict[str, Any]]:
         """Process CV text with Azure OpenAI to extract structured data"""
+        # A CV seen before (even by another process or before a restart) skips the API call
+        cache_path = self._extraction_cache_path(cv_text)
+        if cache_path:
+            cached = self._load_cached_extraction(cache_path)
+            if cached:
+                logging.info("Using cached CV extraction")
+                return cached
+        
         if not self.client:
             logging.error("OpenAI client not initialized")
             return None
@@ -80,19 +190,17 @@ class CVProcessor:
                         "content": prompt
                     }
                 ],
-                temperature=0.1
+                temperature=0.1,
+                # JSON mode: the service guarantees a bare JSON object, so no text has to be stripped around it
+                response_format={"type": "json_object"}
             )
             
             # Parse the response
             content = response.choices[0].message.content
             logging.info(f"OpenAI response received: {len(content)} characters")
             
-            # Extract JSON from response (in case there's extra text)
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                json_str = json_match.group()
-                candidate_data = json.loads(json_str)
-                
+            candidate_data = json.loads(content)
+            if isinstance(candidate_data, dict):
                 # Enhanced validation and cleaning
                 cleaned_data = self._enhanced_validate_and_clean_data(candidate_data)
                 
@@ -102,9 +210,12 @@ class CVProcessor:
                 # Log extraction summary for debugging
                 self._log_extraction_summary(cleaned_data)
                 
+                if cache_path:
+                    self._store_cached_extraction(cache_path, cleaned_data)
+                
                 return cleaned_data
             else:
-                logging.error("No valid JSON found in OpenAI response")
+                logging.error("OpenAI response was not a JSON object")
                 logging.debug(f"OpenAI response content: {content}")
                 return None
                 
@@ -116,16 +227,141 @@ class CVProcessor:
             logging.error(f"Error processing CV with OpenAI: {str(e)}")
             return None
     
+    def process_cvs_batch(self, cv_texts: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Extract several CVs with as few OpenAI calls as possible; results follow the input order"""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(cv_texts)
+        pending = []
+        for i, cv_text in enumerate(cv_texts):
+            cache_path = self._extraction_cache_path(cv_text)
+            cached = self._load_cached_extraction(cache_path) if cache_path else None
+            if cached:
+                results[i] = cached
+            else:
+                pending.append(i)
+        
+        if pending and not self.client:
+            logging.error("OpenAI client not initialized")
+            return results
+        
+        # Group the uncached CVs into sub-batches within the size limits
+        batches, current, current_chars = [], [], 0
+        for i in pending:
+            if current and (len(current) >= BATCH_MAX_CVS or current_chars + len(cv_texts[i]) > BATCH_MAX_CHARS):
+                batches.append(current)
+                current, current_chars = [], 0
+            current.append(i)
+            current_chars += len(cv_texts[i])
+        if current:
+            batches.append(current)
+        
+        # The calls are network-bound, so sub-batches overlap on threads instead of running back to back
+        if batches:
+            with ThreadPoolExecutor(max_workers=min(BATCH_CONCURRENCY, len(batches))) as pool:
+                extracted = pool.map(self._extract_batch, [[cv_texts[i] for i in batch] for batch in batches])
+                for batch, batch_results in zip(batches, extracted):
+                    for i, data in zip(batch, batch_results):
+                        results[i] = data
+        
+        logging.info(f"Batch CV extraction: {len(cv_texts) - len(pending)} cached, {len(pending)} sent in {len(batches)} call(s)")
+        return results
+    
+    def _extract_batch(self, cv_texts: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """One OpenAI call for a group of CVs, halving the group when it exceeds the context window"""
+        if len(cv_texts) == 1:
+            return [self.process_cv_with_openai(cv_texts[0])]
+        
+        try:
+            response = self.client.chat.completions.create(
+                model=Config.AZURE_OPENAI_DEPLOYMENT_NAME,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are an expert HR assistant that extracts comprehensive structured information from CV/resume text. You must extract ALL available information and return complete, valid JSON. Be thorough and extract every detail mentioned in each CV."
+                    },
+                    {
+                        "role": "user",
+                        "content": self._create_batch_extraction_prompt(cv_texts)
+                    }
+                ],
+                temperature=0.1,
+                response_format={"type": "json_object"}
+            )
+        except BadRequestError as e:
+            if getattr(e, 'code', None) != 'context_length_exceeded':
+                logging.error(f"Error processing CV batch with OpenAI: {str(e)}")
+                return [None] * len(cv_texts)
+            half = len(cv_texts) // 2
+            logging.warning(f"CV batch of {len(cv_texts)} exceeded the context window, retrying as {half} + {len(cv_texts) - half}")
+            return self._extract_batch(cv_texts[:half]) + self._extract_batch(cv_texts[half:])
+        except Exception as e:
+            logging.error(f"Error processing CV batch with OpenAI: {str(e)}")
+            return [None] * len(cv_texts)
+        
+        try:
+            records = json.loads(response.choices[0].message.content or '{}').get('candidates')
+        except (json.JSONDecodeError, AttributeError) as e:
+            logging.error(f"JSON decode error in batch response: {str(e)}")
+            records = None
+        
+        # Records are matched to CVs by the cv_index the model echoes back, never by array position
+        if isinstance(records, list) and all(isinstance(r, dict) for r in records):
+            indexes = [r.get('cv_index') for r in records]
+        else:
+            indexes = None
+        
+        # key=str only lets mixed types sort; the comparison itself still requires the exact ints 1..N
+        if indexes is None or sorted(indexes, key=str) != sorted(range(1, len(cv_texts) + 1), key=str):
+            # A malformed, truncated or mis-numbered batch response falls back to one call per CV
+            logging.warning("Batch response did not match the CVs sent, extracting them individually")
+            return [self.process_cv_with_openai(cv_text) for cv_text in cv_texts]
+        
+        by_index = {r['cv_index']: r for r in records}
+        results = []
+        for cv_index, cv_text in enumerate(cv_texts, 1):
+            record = by_index[cv_index]
+            cleaned_data = self._enhanced_validate_and_clean_data(record)
+            self._log_extraction_summary(cleaned_data)
+            cache_path = self._extraction_cache_path(cv_text)
+            if cache_path:
+                self._store_cached_extraction(cache_path, cleaned_data)
+            results.append(cleaned_data)
+        return results
+    
+    def _create_batch_extraction_prompt(self, cv_texts: List[str]) -> str:
+        """Create a prompt extracting several numbered CVs into one JSON array"""
+        numbered = "\n\n".join(f"CV {i}:\n{cv_text}" for i, cv_text in enumerate(cv_texts, 1))
+        return f"""
+You will be given {len(cv_texts)} separate CVs, numbered 1 to {len(cv_texts)}.
+Apply the instructions below to EACH CV independently and return a JSON object of the form
+{{"candidates": [...]}} whose array holds exactly {len(cv_texts)} objects, one per CV.
+Every object MUST also contain "cv_index": the number (1 to {len(cv_texts)}) of the CV it was extracted from.
+Never merge information between CVs.
+{self._extraction_instructions()}
+CVs:
+{numbered}
+
+Return ONLY the JSON object, no additional text:
+"""
+    
     def _create_enhanced_extraction_prompt(self, cv_text: str) -> str:
         """Create enhanced prompt for comprehensive CV data extraction"""
-        return f"""
+        return f"""{self._extraction_instructions()}
+CV Text:
+{cv_text}
+
+Return ONLY the JSON object, no additional text:
+"""
+    
+    def _extraction_instructions(self) -> str:
+        """Schema and extraction guidelines shared by the single and batched CV prompts"""
+        return """
 Extract ALL information from this CV/resume and return it as a comprehensive JSON object. 
 Extract EVERY detail mentioned, no matter how small. Be thorough and complete.
 
 CRITICAL: You must extract information for ALL these fields. If a field is not explicitly mentioned, try to infer it from context or set it as empty string/array.
 
 Required JSON structure:
-{{
+{
     "name": "Full name of the candidate",
     "current_role": "Current job title/position",
     "email": "Email address", 
@@ -138,7 +374,7 @@ Required JSON structure:
     "special_skills": "Any special skills, certifications, languages, or unique abilities mentioned",
     
     "experience": [
-        {{
+        {
             "position": "Job title/role name",
             "company": "Company/organization name", 
             "years": "Duration in role (e.g., '2020-2023', '3 years', 'Jan 2020 - Present')",
@@ -158,23 +394,23 @@ Required JSON structure:
             "technologies": [
                 "Technology 1", "Tool 1", "Software 1", "Programming language 1"
             ]
-        }}
+        }
     ],
     
     "skills": [
-        {{
+        {
             "skill": "Skill name",
             "proficiency": 1-5 (1=Beginner, 2=Basic, 3=Intermediate, 4=Advanced, 5=Expert)
-        }}
+        }
     ],
     
     "qualifications": [
-        {{
+        {
             "qualification": "Degree/certification name",
             "institution": "Educational institution/university",
             "year": "Year of completion", 
             "grade": "Grade/GPA/result if mentioned"
-        }}
+        }
     ],
     
     "achievements": [
@@ -182,7 +418,7 @@ Required JSON structure:
         "Publication, patent, or significant accomplishment 2",
         "Professional certification or notable project 3"
     ]
-}}
+}
 
 EXTRACTION GUIDELINES:
 1. EXTRACT ALL WORK EXPERIENCE - scan the entire CV for every job, internship, project role
@@ -210,11 +446,6 @@ IMPORTANT:
 - Extract soft skills, technical skills, and domain expertise
 - Include internships, part-time work, freelance projects
 - Capture all educational background including certifications
-
-CV Text:
-{cv_text}
-
-Return ONLY the JSON object, no additional text:
 """
     
     def _enhanced_validate_and_clean_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -487,21 +718,16 @@ Return ONLY the JSON object, no additional text:
                         "content": prompt
                     }
                 ],
-                temperature=0.1
+                temperature=0.1,
+                response_format={"type": "json_object"}
             )
             
-            content = response.choices[0].message.content
-            
-            # Extract JSON from response
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                json_str = json_match.group()
-                requirements = json.loads(json_str)
-                
+            requirements = json.loads(response.choices[0].message.content)
+            if isinstance(requirements, dict):
                 logging.info("Successfully extracted job requirements")
                 return requirements
             else:
-                logging.error("No valid JSON found in job requirements response")
+                logging.error("Job requirements response was not a JSON object")
                 return None
                 
         except json.JSONDecodeError as e:
@@ -1,41 +1,42 @@
 import streamlit as st
-from utils import format_datetime_gmt_plus_2, format_current_time_gmt_plus_2
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from session_management import get_db_manager, clear_candidate_caches, dashboard_stats_cached
+from utils import format_datetime_gmt_plus_2, format_current_time_gmt_plus_2, metric_grid_html
 
 
 def dashboard_tab():
     st.markdown('<div class="section-header"><h2>📊 Dashboard</h2></div>', unsafe_allow_html=True)
-    
+    _dashboard_panel()
+
+@st.fragment
+def _dashboard_panel():
+    """Metrics and maintenance controls; their buttons and data refreshes rerun only this fragment"""
     # Show current time in GMT+2
     current_time = format_current_time_gmt_plus_2()
     st.markdown(f"**Current Time:** {current_time}")
     
     # Get statistics
-    stats = st.session_state.db_manager.get_dashboard_stats()
-    sync_status = st.session_state.db_manager.get_sync_status()
+    stats = dashboard_stats_cached()
     
     # Professional metrics display
-    col1, col2, col3, col4, col5 = st.columns(5)
-    
-    with col1:
-        st.metric("Total Candidates", stats.get('total_candidates', 0))
-    
-    with col2:
-        st.metric("Industries", stats.get('unique_industries', 0))
-    
-    with col3:
-        st.metric("Avg Experience", f"{stats.get('avg_experience', 0):.1f} years")
-    
-    with col4:
-        backup_status = "✅ Active" if st.session_state.db_manager.last_backup_time else "❌ Never"
-        st.metric("Backup Status", backup_status)
-    
-    with col5:
-        db_size = f"{stats.get('database_size_mb', 0):.1f} MB"
-        st.metric("DB Size", db_size)
+    backup_status = "✅ Active" if get_db_manager().last_backup_time else "❌ Never"
+    st.markdown(metric_grid_html([
+        ("Total Candidates", stats.get('total_candidates', 0)),
+        ("Industries", stats.get('unique_industries', 0)),
+        ("Avg Experience", f"{stats.get('avg_experience', 0):.1f} years"),
+        ("Backup Status", backup_status),
+        ("DB Size", f"{stats.get('database_size_mb', 0):.1f} MB")
+    ]), unsafe_allow_html=True)
+    
+    _sync_and_backup_controls()
+
+def _sync_and_backup_controls():
+    """Database sync status, cloud sync and backup controls"""
+    sync_status = get_db_manager().get_sync_status()
     
     # Sync Status Section
     st.markdown("---")
-    st.markdown('<div class="form-container">', unsafe_allow_html=True)
     st.subheader("🔄 Database Sync Status")
     
     col1, col2 = st.columns(2)
@@ -63,48 +64,86 @@ def dashboard_tab():
         with sync_col1:
             if st.button("📤 Sync to Cloud", type="primary", help="Upload local changes to blob storage"):
                 with st.spinner("Syncing to cloud..."):
-                    result = st.session_state.db_manager.sync_database()
+                    result = get_db_manager().sync_database()
                     if result:
                         st.success("✅ Sync successful!")
-                        st.rerun()
+                        st.rerun(scope="fragment")
                     else:
                         st.error("❌ Sync failed!")
         
         with sync_col2:
             if st.button("📥 Refresh from Cloud", help="Download latest from blob storage"):
                 with st.spinner("Refreshing from cloud..."):
-                    result = st.session_state.db_manager.refresh_database()
+                    result = get_db_manager().refresh_database()
                     if result:
+                        clear_candidate_caches()
                         st.success("✅ Refresh successful!")
-                        st.rerun()
+                        # Cached reads are cleared, so other tabs load fresh data when next shown
+                        st.rerun(scope="fragment")
                     else:
                         st.error("❌ Refresh failed!")
     
-    st.markdown('</div>', unsafe_allow_html=True)
-    
     # Backup controls with professional styling
-    st.markdown('<div class="form-container">', unsafe_allow_html=True)
     st.subheader("🔄 Database Backup")
+    
+    # Backup and restore run on a worker thread; a polling fragment reports when they finish
+    job_running = 'maintenance_job' in st.session_state
     col1, col2 = st.columns(2)
     
     with col1:
-        if st.button("💾 Create Backup Now", type="primary"):
-            with st.spinner("Creating backup..."):
-                result = st.session_state.db_manager.backup_to_blob()
-                if result:
-                    backup_time = format_current_time_gmt_plus_2()
-                    st.markdown(f'<div class="success-message">✅ Backup created successfully at {backup_time}!</div>', unsafe_allow_html=True)
-                else:
-                    st.markdown('<div class="error-message">❌ Backup failed!</div>', unsafe_allow_html=True)
+        st.button("💾 Create Backup Now", type="primary", disabled=job_running,
+                  on_click=_start_maintenance_job, args=('backup',))
     
     with col2:
-        if st.button("📥 Restore from Latest Backup"):
-            with st.spinner("Restoring from backup..."):
-                result = st.session_state.db_manager.restore_from_backup()
-                if result:
-                    restore_time = format_current_time_gmt_plus_2()
-                    st.markdown(f'<div class="success-message">✅ Database restored successfully at {restore_time}!</div>', unsafe_allow_html=True)
-                    st.rerun()
-                else:
-                    st.markdown('<div class="error-message">❌ Restore failed!</div>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
\ No newline at end of file
+        st.button("📥 Restore from Latest Backup", disabled=job_running,
+                  on_click=_start_maintenance_job, args=('restore',))
+    
+    if job_running:
+        _maintenance_job_progress()
+    
+    finished = st.session_state.pop('maintenance_result', None)
+    if finished:
+        kind, result, finished_time = finished
+        if kind == 'backup':
+            if result:
+                st.markdown(f'<div class="success-message">✅ Backup created successfully at {finished_time}!</div>', unsafe_allow_html=True)
+            else:
+                st.markdown('<div class="error-message">❌ Backup failed!</div>', unsafe_allow_html=True)
+        else:
+            if result:
+                st.markdown(f'<div class="success-message">✅ Database restored successfully at {finished_time}!</div>', unsafe_allow_html=True)
+            else:
+                st.markdown('<div class="error-message">❌ Restore failed!</div>', unsafe_allow_html=True)
+
+@st.cache_resource
+def _maintenance_executor():
+    """Process-wide worker for blob backup and restore jobs, so they never overlap"""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="blob-maintenance")
+
+def _start_maintenance_job(kind):
+    """Button callback: submit a backup or restore job instead of blocking the session on blob I/O"""
+    db_manager = get_db_manager()
+    task = db_manager.backup_to_blob if kind == 'backup' else db_manager.restore_from_backup
+    st.session_state.maintenance_job = (kind, _maintenance_executor().submit(task))
+
+@st.fragment(run_every=1.0)
+def _maintenance_job_progress():
+    """Poll the running backup/restore job once a second"""
+    kind, future = st.session_state.maintenance_job
+    if not future.done():
+        st.info("🔄 Creating backup..." if kind == 'backup' else "🔄 Restoring from backup...")
+        return
+    
+    try:
+        result = future.result()
+    except Exception as e:
+        logging.error(f"❌ Background {kind} failed: {str(e)}")
+        result = False
+    
+    if result and kind == 'restore':
+        clear_candidate_caches()
+    
+    del st.session_state.maintenance_job
+    st.session_state.maintenance_result = (kind, result, format_current_time_gmt_plus_2())
+    # A nested fragment cannot rerun its parent, so this full rerun (once per job) stops the poller
+    st.rerun()
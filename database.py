@@ -114,6 +114,12 @@ class DatabaseManager:
         
         return best_recency_score > 0, best_recency_score
 
+    def _comment_search_terms(self, search_comments: str) -> List[str]:
+        """Parse comment search terms (comma-separated or space-separated)"""
+        if ',' in search_comments:
+            return [term.strip().lower() for term in search_comments.split(',') if term.strip()]
+        return [term.strip().lower() for term in search_comments.split() if len(term.strip()) > 2]
+
     def _match_comments(self, candidate: Dict[str, Any], search_comments: str) -> bool:
         """
         Check if candidate's comments match the search terms
@@ -124,13 +130,7 @@ class DatabaseManager:
         search_lower = search_comments.lower()
         candidate_comments = candidate.get('comments', '').lower()
         
-        # Parse search terms (comma-separated or space-separated)
-        search_terms = []
-        if ',' in search_comments:
-            search_terms = [term.strip().lower() for term in search_comments.split(',') if term.strip()]
-        else:
-            search_terms = [term.strip().lower() for term in search_comments.split() if len(term.strip()) > 2]
-        
+        search_terms = self._comment_search_terms(search_comments)
         if not search_terms:
             return search_lower in candidate_comments
         
@@ -154,44 +154,38 @@ class DatabaseManager:
     def insert_candidate(self, candidate_data: Dict[str, Any]) -> Tuple[bool, str]:
         """Insert a new candidate into the database with FORCED cloud sync"""
         try:
-            # Check if email already exists
-            existing_candidate = self.get_candidate_by_email(candidate_data.get('email'))
-            if existing_candidate:
-                logging.warning(f"Candidate with email {candidate_data.get('email')} already exists")
-                return False, "A candidate with this email already exists"
-            
-            conn = self.blob_db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                INSERT INTO candidates (
-                    name, current_role, email, phone, notice_period, current_salary,
-                    industry, desired_salary, highest_qualification, experience,
-                    skills, qualifications, achievements, special_skills, comments,
-                    created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                candidate_data.get('name'),
-                candidate_data.get('current_role'),
-                candidate_data.get('email'),
-                candidate_data.get('phone'),
-                candidate_data.get('notice_period'),
-                candidate_data.get('current_salary'),
-                candidate_data.get('industry'),
-                candidate_data.get('desired_salary'),
-                candidate_data.get('highest_qualification'),
-                json.dumps(candidate_data.get('experience', [])),
-                json.dumps(candidate_data.get('skills', [])),
-                json.dumps(candidate_data.get('qualifications', [])),
-                json.dumps(candidate_data.get('achievements', [])),
-                candidate_data.get('special_skills'),
-                candidate_data.get('comments', ''),  # New comments field
-                datetime.now(),
-                datetime.now()
-            ))
-            
-            conn.commit()
-            conn.close()
+            # Duplicate emails are rejected by the UNIQUE constraint (handled below), so no lookup is needed first
+            with self.blob_db.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    INSERT INTO candidates (
+                        name, current_role, email, phone, notice_period, current_salary,
+                        industry, desired_salary, highest_qualification, experience,
+                        skills, qualifications, achievements, special_skills, comments,
+                        created_at, updated_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    candidate_data.get('name'),
+                    candidate_data.get('current_role'),
+                    candidate_data.get('email'),
+                    candidate_data.get('phone'),
+                    candidate_data.get('notice_period'),
+                    candidate_data.get('current_salary'),
+                    candidate_data.get('industry'),
+                    candidate_data.get('desired_salary'),
+                    candidate_data.get('highest_qualification'),
+                    json.dumps(candidate_data.get('experience', [])),
+                    json.dumps(candidate_data.get('skills', [])),
+                    json.dumps(candidate_data.get('qualifications', [])),
+                    json.dumps(candidate_data.get('achievements', [])),
+                    candidate_data.get('special_skills'),
+                    candidate_data.get('comments', ''),  # New comments field
+                    datetime.now(),
+                    datetime.now()
+                ))
+                
+                conn.commit()
             
             # CRITICAL: FORCE immediate sync to cloud - BLOCKING OPERATION
             logging.info("🔄 FORCING IMMEDIATE CLOUD SYNC after candidate insertion")
@@ -227,38 +221,37 @@ class DatabaseManager:
             if not existing_candidate:
                 return False, f"Candidate with email {email} not found"
             
-            conn = self.blob_db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                UPDATE candidates SET
-                    name = ?, current_role = ?, phone = ?, notice_period = ?,
-                    current_salary = ?, industry = ?, desired_salary = ?,
-                    highest_qualification = ?, experience = ?, skills = ?,
-                    qualifications = ?, achievements = ?, special_skills = ?,
-                    comments = ?, updated_at = ?
-                WHERE email = ?
-            """, (
-                candidate_data.get('name'),
-                candidate_data.get('current_role'),
-                candidate_data.get('phone'),
-                candidate_data.get('notice_period'),
-                candidate_data.get('current_salary'),
-                candidate_data.get('industry'),
-                candidate_data.get('desired_salary'),
-                candidate_data.get('highest_qualification'),
-                json.dumps(candidate_data.get('experience', [])),
-                json.dumps(candidate_data.get('skills', [])),
-                json.dumps(candidate_data.get('qualifications', [])),
-                json.dumps(candidate_data.get('achievements', [])),
-                candidate_data.get('special_skills'),
-                candidate_data.get('comments', ''),  # New comments field
-                datetime.now(),
-                email
-            ))
-            
-            conn.commit()
-            conn.close()
+            with self.blob_db.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    UPDATE candidates SET
+                        name = ?, current_role = ?, phone = ?, notice_period = ?,
+                        current_salary = ?, industry = ?, desired_salary = ?,
+                        highest_qualification = ?, experience = ?, skills = ?,
+                        qualifications = ?, achievements = ?, special_skills = ?,
+                        comments = ?, updated_at = ?
+                    WHERE email = ?
+                """, (
+                    candidate_data.get('name'),
+                    candidate_data.get('current_role'),
+                    candidate_data.get('phone'),
+                    candidate_data.get('notice_period'),
+                    candidate_data.get('current_salary'),
+                    candidate_data.get('industry'),
+                    candidate_data.get('desired_salary'),
+                    candidate_data.get('highest_qualification'),
+                    json.dumps(candidate_data.get('experience', [])),
+                    json.dumps(candidate_data.get('skills', [])),
+                    json.dumps(candidate_data.get('qualifications', [])),
+                    json.dumps(candidate_data.get('achievements', [])),
+                    candidate_data.get('special_skills'),
+                    candidate_data.get('comments', ''),  # New comments field
+                    datetime.now(),
+                    email
+                ))
+                
+                conn.commit()
             
             # CRITICAL: FORCE immediate sync to cloud - BLOCKING OPERATION
             logging.info("🔄 FORCING IMMEDIATE CLOUD SYNC after candidate update")
@@ -283,17 +276,16 @@ class DatabaseManager:
             if not existing_candidate:
                 return False, f"Candidate with email {email} not found"
             
-            conn = self.blob_db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("DELETE FROM candidates WHERE email = ?", (email,))
-            
-            if cursor.rowcount == 0:
-                conn.close()
-                return False, f"No candidate found with email {email}"
-            
-            conn.commit()
-            conn.close()
+            with self.blob_db.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("DELETE FROM candidates WHERE email = ?", (email,))
+                
+                if cursor.rowcount == 0:
+                    conn.rollback()
+                    return False, f"No candidate found with email {email}"
+                
+                conn.commit()
             
             # CRITICAL: FORCE immediate sync to cloud - BLOCKING OPERATION
             logging.info("🔄 FORCING IMMEDIATE CLOUD SYNC after candidate deletion")
@@ -341,35 +333,50 @@ class DatabaseManager:
     def search_candidates(self, search_criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Search candidates based on criteria with enhanced skills search, company matching, and comments search"""
         try:
-            conn = self.blob_db.get_connection()
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            # Build dynamic query (excluding fields that need special handling)
-            where_clauses = []
-            params = []
-            
-            # Fields that can be directly queried from database columns
-            direct_search_fields = ['name', 'current_role', 'industry', 'notice_period', 
-                                'highest_qualification', 'phone', 'email']
-            
-            for field, value in search_criteria.items():
-                if value and value != "":
-                    # Skip fields that need special handling
-                    if field in ['experience_years', 'skills', 'responsibilities', 'qualifications', 'company', 'comments']:
-                        continue  # Handle these separately after getting all candidates
-                    elif field in direct_search_fields:
-                        # Make searches case-insensitive for direct database columns
-                        where_clauses.append(f"LOWER({field}) LIKE LOWER(?)")
-                        params.append(f"%{value}%")
-            
-            # Base query to get all candidates (or filtered by direct fields)
-            query = "SELECT * FROM candidates"
-            if where_clauses:
-                query += " WHERE " + " AND ".join(where_clauses)
-            
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
+            with self.blob_db.connection() as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
+                
+                # Build dynamic query (excluding fields that need special handling)
+                where_clauses = []
+                params = []
+                
+                # Fields that can be directly queried from database columns
+                direct_search_fields = ['name', 'current_role', 'industry', 'notice_period', 
+                                    'highest_qualification', 'phone', 'email']
+                
+                for field, value in search_criteria.items():
+                    if value and value != "":
+                        # Skip fields that need special handling
+                        if field in ['experience_years', 'skills', 'responsibilities', 'qualifications', 'company', 'comments']:
+                            continue  # Handle these separately after getting all candidates
+                        elif field in direct_search_fields:
+                            # Make searches case-insensitive for direct database columns
+                            where_clauses.append(f"LOWER({field}) LIKE LOWER(?)")
+                            params.append(f"%{value}%")
+                
+                # Pre-filter the JSON-backed criteria in SQL so non-matching rows are never fetched and parsed;
+                # the Python checks below stay authoritative
+                min_experience = search_criteria.get('experience_years', 0)
+                if min_experience > 0:
+                    where_clauses.append("json_array_length(experience) >= ?")
+                    params.append(min_experience)
+                
+                comments_search = search_criteria.get('comments', '')
+                if comments_search and comments_search.strip():
+                    comment_terms = self._comment_search_terms(comments_search) or [comments_search.lower()]
+                    # SQLite only case-folds ASCII, so non-ASCII terms are left to the Python check
+                    if all(term.isascii() for term in comment_terms):
+                        where_clauses.append("(" + " OR ".join(["LOWER(comments) LIKE ?"] * len(comment_terms)) + ")")
+                        params.extend(f"%{term}%" for term in comment_terms)
+                
+                # Base query to get all candidates (or filtered by direct fields)
+                query = "SELECT * FROM candidates"
+                if where_clauses:
+                    query += " WHERE " + " AND ".join(where_clauses)
+                
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
             
             candidates = []
             skills_search = search_criteria.get('skills', '')
@@ -429,7 +436,6 @@ class DatabaseManager:
                 candidates_with_scores.sort(key=lambda x: x.get('company_recency_score', 0), reverse=True)
                 logging.info(f"Company search performed for '{company_search}' - results sorted by recency")
             
-            conn.close()
             return candidates_with_scores
             
         except Exception as e:
@@ -439,12 +445,12 @@ class DatabaseManager:
     def search_candidates_by_job_requirements(self, requirements: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Search candidates based on job requirements"""
         try:
-            conn = self.blob_db.get_connection()
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT * FROM candidates")
-            rows = cursor.fetchall()
+            with self.blob_db.connection() as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
+                
+                cursor.execute("SELECT * FROM candidates")
+                rows = cursor.fetchall()
             
             candidates = []
             for row in rows:
@@ -458,7 +464,6 @@ class DatabaseManager:
                 
                 candidates.append(candidate)
             
-            conn.close()
             return candidates
             
         except Exception as e:
@@ -468,35 +473,21 @@ class DatabaseManager:
     def get_dashboard_stats(self) -> Dict[str, Any]:
         """Get dashboard statistics"""
         try:
-            conn = self.blob_db.get_connection()
-            cursor = conn.cursor()
-            
-            # Total candidates
-            cursor.execute("SELECT COUNT(*) FROM candidates")
-            total_candidates = cursor.fetchone()[0]
-            
-            # Unique industries
-            cursor.execute("SELECT COUNT(DISTINCT industry) FROM candidates WHERE industry IS NOT NULL AND industry != ''")
-            unique_industries = cursor.fetchone()[0]
-            
-            # Average experience
-            cursor.execute("SELECT experience FROM candidates WHERE experience IS NOT NULL")
-            experience_data = cursor.fetchall()
-            
-            total_experience = 0
-            candidate_count = 0
-            for exp_row in experience_data:
-                try:
-                    exp_list = json.loads(exp_row[0])
-                    if exp_list:
-                        total_experience += len(exp_list)
-                        candidate_count += 1
-                except:
-                    continue
-            
-            avg_experience = total_experience / candidate_count if candidate_count > 0 else 0
-            
-            conn.close()
+            with self.blob_db.connection() as conn:
+                cursor = conn.cursor()
+                
+                # Totals, distinct industries and average positions per candidate in one pass, so the
+                # experience JSON is measured in SQLite instead of being fetched and parsed row by row
+                cursor.execute("""
+                    SELECT COUNT(*),
+                           COUNT(DISTINCT CASE WHEN industry != '' THEN industry END),
+                           AVG(CASE WHEN json_valid(experience) AND json_array_length(experience) > 0
+                                    THEN json_array_length(experience) END)
+                    FROM candidates
+                """)
+                total_candidates, unique_industries, avg_experience = cursor.fetchone()
+            
+            avg_experience = avg_experience or 0
             
             # Get sync status
             sync_status = self.blob_db.get_sync_status()
@@ -522,15 +513,14 @@ class DatabaseManager:
     def get_candidate_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """Get a candidate by email address"""
         try:
-            conn = self.blob_db.get_connection()
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT * FROM candidates WHERE email = ?", (email,))
-            row = cursor.fetchone()
+            with self.blob_db.connection() as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
+                
+                cursor.execute("SELECT * FROM candidates WHERE email = ?", (email,))
+                row = cursor.fetchone()
             
             if not row:
-                conn.close()
                 return None
             
             candidate = dict(row)
@@ -541,7 +531,6 @@ class DatabaseManager:
             candidate['qualifications'] = json.loads(candidate.get('qualifications', '[]'))
             candidate['achievements'] = json.loads(candidate.get('achievements', '[]'))
             
-            conn.close()
             return candidate
             
         except Exception as e:
@@ -614,14 +603,14 @@ class DatabaseManager:
                 return False
             
             # Download backup and upload to main database location
-            backup_data = backup_blob_client.download_blob().readall()
+            backup_data = backup_blob_client.download_blob(max_concurrency=Config.BLOB_TRANSFER_CONCURRENCY).readall()
             
             main_blob_client = self.blob_db.blob_service_client.get_blob_client(
                 container=self.blob_db.db_container,
                 blob=self.blob_db.db_blob_name
             )
             
-            main_blob_client.upload_blob(backup_data, overwrite=True)
+            main_blob_client.upload_blob(backup_data, overwrite=True, max_concurrency=Config.BLOB_TRANSFER_CONCURRENCY)
             
             # Force refresh local database
             self.blob_db.force_refresh()
@@ -636,16 +625,15 @@ class DatabaseManager:
     def _log_backup(self, backup_name: str, status: str, file_size: int):
         """Log backup operation"""
         try:
-            conn = self.blob_db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO backup_log (backup_name, status, file_size)
-                VALUES (?, ?, ?)
-            ''', (backup_name, status, file_size))
-            
-            conn.commit()
-            conn.close()
+            with self.blob_db.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    INSERT INTO backup_log (backup_name, status, file_size)
+                    VALUES (?, ?, ?)
+                ''', (backup_name, status, file_size))
+                
+                conn.commit()
             
             # Sync after logging
             self.blob_db.sync_to_blob()
@@ -656,12 +644,11 @@ class DatabaseManager:
     def _schedule_backup(self):
         """Schedule automatic backup"""
         try:
-            conn = self.blob_db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT COUNT(*) FROM candidates")
-            total_candidates = cursor.fetchone()[0]
-            conn.close()
+            with self.blob_db.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("SELECT COUNT(*) FROM candidates")
+                total_candidates = cursor.fetchone()[0]
             
             # Backup every 5 candidates
             if total_candidates % 5 == 0:
@@ -2,6 +2,23 @@ import streamlit as st
 from auth import AuthManager, init_auth_session_state
 from typing import Dict
 
+@st.cache_resource
+def _logo_html():
+    """Logo markup with the image inlined as base64, read and encoded once per process"""
+    import base64
+    import os
+    from pathlib import Path
+    
+    # Get the path to the logo image
+    logo_path = Path(os.path.join("static", "kts-logo.png"))
+    
+    # Check if the logo exists, otherwise fallback to text
+    if logo_path.exists():
+        with open(logo_path, "rb") as img_file:
+            encoded_image = base64.b64encode(img_file.read()).decode()
+        return f'<img src="data:image/png;base64,{encoded_image}" alt="Key Talent Solutions Logo" style="width:70px; height:70px; border-radius:50%; object-fit:cover; display:block; margin:0 auto 1.5rem auto;">'
+    return '<div class="logo-icon">KTS</div>'
+
 def show_landing_page():
     """Display the landing page with Microsoft authentication"""
     # Initialize auth session state
@@ -472,21 +489,7 @@ def show_main_card():
     if auth_url:
         # Show the main login card
             
-            # Load and encode the logo image
-            import base64
-            import os
-            from pathlib import Path
-            
-            # Get the path to the logo image
-            logo_path = Path(os.path.join("static", "kts-logo.png"))
-            
-            # Check if the logo exists, otherwise fallback to text
-            if logo_path.exists():
-                with open(logo_path, "rb") as img_file:
-                    encoded_image = base64.b64encode(img_file.read()).decode()
-                logo_html = f'<img src="data:image/png;base64,{encoded_image}" alt="Key Talent Solutions Logo" style="width:70px; height:70px; border-radius:50%; object-fit:cover; display:block; margin:0 auto 1.5rem auto;">'
-            else:
-                logo_html = '<div class="logo-icon">KTS</div>'
+            logo_html = _logo_html()
                 
             st.markdown(f"""
             <div class="main-card">
@@ -608,8 +611,6 @@ def handle_auth_callback(auth_code: str):
             # CRITICAL: Force database refresh from cloud on login
             st.session_state.user_session_initialized = False
             st.session_state.db_initialized = False
-            if 'db_manager' in st.session_state:
-                del st.session_state['db_manager']
             
             # Clear query parameters
             st.query_params.clear()
@@ -699,10 +700,11 @@ def show_user_profile():
             
             # Manual sync button for debugging
             if st.button("🔄 Manual Sync to Cloud", use_container_width=True, help="Manually sync current data to cloud"):
-                if 'db_manager' in st.session_state and st.session_state.db_manager:
+                if st.session_state.get('db_initialized'):
                     with st.spinner("🔄 Syncing to cloud..."):
                         try:
-                            success = st.session_state.db_manager.ensure_cloud_sync()
+                            from session_management import get_db_manager
+                            success = get_db_manager().ensure_cloud_sync()
                             if success:
                                 st.success("✅ Manual sync successful!")
                             else:
@@ -726,13 +728,14 @@ def show_user_profile():
                     sync_success = False
                     
                     # CRITICAL: Sync to cloud before logout
-                    if 'db_manager' in st.session_state and st.session_state.db_manager:
+                    if st.session_state.get('db_initialized'):
                         try:
                             import logging
+                            from session_management import get_db_manager
                             logging.info("🔄 STARTING: Syncing database to cloud before logout")
                             
                             # Force sync with blocking operation
-                            sync_success = st.session_state.db_manager.ensure_cloud_sync()
+                            sync_success = get_db_manager().ensure_cloud_sync()
                             
                             if sync_success:
                                 logging.info("✅ SUCCESS: Database synced to cloud before logout")
@@ -763,15 +766,12 @@ def show_user_profile():
                 st.session_state.user_session_initialized = False
                 st.session_state.db_initialized = False
                 
-                # Clear database manager to force re-initialization on next login
-                if 'db_manager' in st.session_state:
-                    del st.session_state['db_manager']
-                
                 # Clear all cached data
                 if 'cached_search_results' in st.session_state:
                     del st.session_state['cached_search_results']
                 if 'cached_search_criteria' in st.session_state:
                     del st.session_state['cached_search_criteria']
+                st.session_state.pop('_initialized', None)  # restore the deleted defaults on next run
                 if 'search_performed' in st.session_state:
                     st.session_state.search_performed = False
                 
@@ -1,7 +1,18 @@
 import streamlit as st
 import logging
-from session_management import clear_search_state
-from utils import format_datetime_gmt_plus_2, format_current_time_gmt_plus_2
+import math
+from operator import itemgetter
+from itertools import takewhile
+from session_management import (
+    clear_search_state, get_cv_processor, search_candidates_cached, rank_by_requirements_cached
+)
+from utils import format_datetime_gmt_plus_2, format_current_time_gmt_plus_2, metric_grid_html
+
+RESULTS_PAGE_SIZE = 25
+
+def _debug_enabled():
+    """Debug panels are opt-in via ?debug=1 so regular searches do not render them"""
+    return st.query_params.get("debug") == "1"
 
 def search_candidates_tab():
     st.markdown('<div class="section-header"><h2>🔍 Search Candidates</h2></div>', unsafe_allow_html=True)
@@ -31,7 +42,6 @@ def search_candidates_tab():
         st.markdown('<div class="warning-message">🔍 No candidates found matching your criteria.</div>', unsafe_allow_html=True)
 
 def manual_search():
-    st.markdown('<div class="form-container">', unsafe_allow_html=True)
     st.subheader("🔍 Enhanced Manual Search")
     
     
@@ -101,7 +111,6 @@ def manual_search():
             )
             
         search_submitted = st.form_submit_button("🔍 Search", type="primary")
-    st.markdown('</div>', unsafe_allow_html=True)
     
     if search_submitted:
         search_criteria = {
@@ -123,7 +132,7 @@ def manual_search():
         # Show search info
         with st.spinner("🔍 Searching candidates with enhanced matching..."):
             # Perform enhanced search
-            results = st.session_state.db_manager.search_candidates(search_criteria)
+            results = search_candidates_cached(search_criteria)
             
             # Add relevance scores to results
             for candidate in results:
@@ -135,6 +144,7 @@ def manual_search():
             
             # Cache results
             st.session_state.cached_search_results = results
+            st.session_state.results_page = 0
             st.session_state.search_performed = True
             
             # Show search summary
@@ -153,34 +163,35 @@ def manual_search():
                     st.info(f"📝 Searching in comments for: {comments_search}")
                 
                 # Show some debug info to help user understand results
-                with st.expander("🔍 Search Debug Info", expanded=False):
-                    st.write("**Search criteria applied:**")
-                    active_criteria = {k: v for k, v in search_criteria.items() if v}
-                    for key, value in active_criteria.items():
-                        st.write(f"• {key.replace('_', ' ').title()}: {value}")
-                    
-                    if results:
-                        top_candidate = results[0]
-                        st.write(f"**Top match: {top_candidate.get('name', 'Unknown')} ({top_candidate.get('relevance_score', 0)}% match)**")
-                        
-                        if search_criteria.get('skills'):
-                            candidate_skills = [skill.get('skill', '') for skill in top_candidate.get('skills', [])]
-                            st.write(f"• Their skills: {', '.join(candidate_skills[:5])}")
-                        
-                        if search_criteria.get('company'):
-                            companies = [exp.get('company', '') for exp in top_candidate.get('experience', []) if exp.get('company')]
-                            st.write(f"• Their companies: {', '.join(companies[:3])}")
+                if _debug_enabled():
+                    with st.expander("🔍 Search Debug Info", expanded=False):
+                        st.write("**Search criteria applied:**")
+                        active_criteria = {k: v for k, v in search_criteria.items() if v}
+                        for key, value in active_criteria.items():
+                            st.write(f"• {key.replace('_', ' ').title()}: {value}")
                         
-                        if search_criteria.get('responsibilities'):
-                            sample_resp = []
-                            for exp in top_candidate.get('experience', []):
-                                sample_resp.extend(exp.get('responsibilities', [])[:1])
-                            st.write(f"• Sample responsibilities: {' | '.join(sample_resp[:3])}")
-                        
-                        if search_criteria.get('comments'):
-                            comments_preview = top_candidate.get('comments', '')[:100]
-                            if comments_preview:
-                                st.write(f"• Comments preview: {comments_preview}{'...' if len(top_candidate.get('comments', '')) > 100 else ''}")
+                        if results:
+                            top_candidate = results[0]
+                            st.write(f"**Top match: {top_candidate.get('name', 'Unknown')} ({top_candidate.get('relevance_score', 0)}% match)**")
+                            
+                            if search_criteria.get('skills'):
+                                candidate_skills = [skill.get('skill', '') for skill in top_candidate.get('skills', [])]
+                                st.write(f"• Their skills: {', '.join(candidate_skills[:5])}")
+                            
+                            if search_criteria.get('company'):
+                                companies = [exp.get('company', '') for exp in top_candidate.get('experience', []) if exp.get('company')]
+                                st.write(f"• Their companies: {', '.join(companies[:3])}")
+                            
+                            if search_criteria.get('responsibilities'):
+                                sample_resp = []
+                                for exp in top_candidate.get('experience', []):
+                                    sample_resp.extend(exp.get('responsibilities', [])[:1])
+                                st.write(f"• Sample responsibilities: {' | '.join(sample_resp[:3])}")
+                            
+                            if search_criteria.get('comments'):
+                                comments_preview = top_candidate.get('comments', '')[:100]
+                                if comments_preview:
+                                    st.write(f"• Comments preview: {comments_preview}{'...' if len(top_candidate.get('comments', '')) > 100 else ''}")
             else:
                 st.warning("⚠️ No candidates found. Try broader search terms or check spelling.")
                 # Provide search suggestions
@@ -218,7 +229,6 @@ def show_search_suggestions(search_criteria):
         st.markdown(suggestion)
 
 def job_description_search():
-    st.markdown('<div class="form-container">', unsafe_allow_html=True)
     st.subheader("📋 AI-Powered Job Description Match")
     
     st.info("""
@@ -275,7 +285,10 @@ Example: We are looking for a Senior Data Scientist with experience in Python, m
             with st.spinner("🤖 Analyzing job description with AI..."):
                 try:
                     # Extract requirements from job description using enhanced OpenAI
-                    requirements = st.session_state.cv_processor.extract_job_requirements(job_description)
+                    try:
+                        requirements = extract_job_requirements_cached(job_description)
+                    except RequirementsExtractionError:
+                        requirements = None
                     
                     if requirements:
                         # Display extracted requirements
@@ -322,14 +335,13 @@ Example: We are looking for a Senior Data Scientist with experience in Python, m
                         
                         # Search for matching candidates
                         with st.spinner("🔍 Searching and ranking candidates..."):
-                            results = st.session_state.db_manager.search_candidates_by_job_requirements(requirements)
-                            ranked_results = rank_candidates_by_enhanced_job_match(results, requirements)
+                            ranked_results = rank_by_requirements_cached(requirements)
                             
                             # ENSURE WE ALWAYS RETURN RESULTS - Apply minimum threshold filter but with fallback
-                            filtered_results = [
-                                candidate for candidate in ranked_results 
-                                if candidate.get('match_score', 0) >= min_match_threshold
-                            ]
+                            # Ranked best-first, so the candidates over the threshold are a prefix
+                            filtered_results = list(takewhile(
+                                lambda candidate: candidate['match_score'] >= min_match_threshold, ranked_results
+                            ))
                             
                             # FALLBACK: If no results meet threshold, return top 10 anyway
                             if not filtered_results and ranked_results:
@@ -339,7 +351,7 @@ Example: We are looking for a Senior Data Scientist with experience in Python, m
                             # SECONDARY FALLBACK: If still no results, return ALL candidates with basic scoring
                             if not filtered_results:
                                 st.warning("No candidates found with job description matching. Showing all candidates with basic scoring.")
-                                all_candidates = st.session_state.db_manager.search_candidates({})  # Get all candidates
+                                all_candidates = search_candidates_cached({})  # Get all candidates
                                 # Give them all a basic score
                                 for candidate in all_candidates:
                                     candidate['match_score'] = 25  # Basic score
@@ -348,6 +360,7 @@ Example: We are looking for a Senior Data Scientist with experience in Python, m
                             
                             # Cache results
                             st.session_state.cached_search_results = filtered_results
+                            st.session_state.results_page = 0
                             st.session_state.search_performed = True
                             st.session_state.cached_search_criteria = {
                                 'job_description': job_description,
@@ -360,20 +373,16 @@ Example: We are looking for a Senior Data Scientist with experience in Python, m
                                 st.success(f"✅ Found {len(filtered_results)} candidates matching the job requirements! (Search completed at {search_time})")
                                 
                                 # Show match distribution
-                                high_match = len([c for c in filtered_results if c.get('match_score', 0) >= 80])
-                                medium_match = len([c for c in filtered_results if 60 <= c.get('match_score', 0) < 80])
-                                low_match = len([c for c in filtered_results if c.get('match_score', 0) < 60])
+                                high_match, medium_match, low_match, _ = _match_summary(filtered_results)
                                 
-                                col1, col2, col3 = st.columns(3)
-                                with col1:
-                                    st.metric("🟢 High Match (80%+)", high_match)
-                                with col2:
-                                    st.metric("🟡 Medium Match (60-79%)", medium_match)
-                                with col3:
-                                    st.metric("🔴 Lower Match (<60%)", low_match)
+                                st.markdown(metric_grid_html([
+                                    ("🟢 High Match (80%+)", high_match),
+                                    ("🟡 Medium Match (60-79%)", medium_match),
+                                    ("🔴 Lower Match (<60%)", low_match)
+                                ]), unsafe_allow_html=True)
                                 
                                 # Debug info for responsibilities matching
-                                if requirements.get('key_responsibilities'):
+                                if _debug_enabled() and requirements.get('key_responsibilities'):
                                     with st.expander("🔍 Debug: Responsibilities Matching", expanded=False):
                                         st.write("**Job Requirements:**")
                                         for resp in requirements.get('key_responsibilities', []):
@@ -393,8 +402,9 @@ Example: We are looking for a Senior Data Scientist with experience in Python, m
                                 st.info("💡 Try lowering the minimum match threshold or using broader job requirements.")
                                 
                                 # Debug: Show what was extracted
-                                with st.expander("🔍 Debug: What was extracted from job description", expanded=True):
-                                    st.json(requirements)
+                                if _debug_enabled():
+                                    with st.expander("🔍 Debug: What was extracted from job description", expanded=True):
+                                        st.json(requirements)
                             
                             st.rerun()
                     else:
@@ -405,7 +415,17 @@ Example: We are looking for a Senior Data Scientist with experience in Python, m
                     st.markdown(f'<div class="error-message">❌ Error processing job description: {str(e)}</div>', unsafe_allow_html=True)
         else:
             st.markdown('<div class="error-message">❌ Please provide a detailed job description (at least 50 characters).</div>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+
+class RequirementsExtractionError(Exception):
+    """Raised when the AI requirement extraction fails, so the failure is not cached"""
+
+@st.cache_data(show_spinner=False)
+def extract_job_requirements_cached(job_description):
+    """Run the OpenAI requirement extraction for a job description, memoized on its text"""
+    requirements = get_cv_processor().extract_job_requirements(job_description)
+    if not requirements:
+        raise RequirementsExtractionError("Failed to extract job requirements")
+    return requirements
 
 def calculate_enhanced_manual_search_relevance(candidate, search_criteria):
     """Enhanced relevance calculation for manual search with comments matching"""
@@ -663,65 +683,111 @@ def calculate_company_match_score(experience_list, company_query):
         logging.error(f"Error calculating company match score: {str(e)}")
         return 0
 
+# Generic work verbs that earn partial credit for a responsibility
+_COMMON_WORK_WORDS = ('manage', 'develop', 'create', 'implement', 'analyze', 'design', 'support', 'lead', 'coordinate', 'maintain')
+
+def _prepare_requirements(requirements):
+    """Lowercase and tokenize the job requirements once, instead of once per candidate"""
+    def lowered(key):
+        return [item.lower() for item in requirements.get(key) or []]
+    
+    industry = (requirements.get('industry') or '').lower()
+    
+    required_skills = lowered('required_skills')[:10]  # Limit to top 10 to avoid over-weighting
+    technologies = lowered('technologies')
+    key_responsibilities = lowered('key_responsibilities')
+    return {
+        'skills': [(skill, [word for word in skill.split() if len(word) > 1]) for skill in required_skills],
+        'technologies': [(tech, [word for word in tech.split() if len(word) > 2]) for tech in technologies],
+        'qualifications': [(qual, [word for word in qual.split() if len(word) > 3]) for qual in lowered('required_qualifications')],
+        'experience_areas': [
+            (area, [word for word in area.split() if len(word) > 3]) for area in lowered('required_experience_areas')
+        ],
+        'responsibilities': [
+            (resp.split(), [phrase.strip() for phrase in resp.split(',') if len(phrase.strip()) > 3],
+             [word for word in _COMMON_WORK_WORDS if word in resp])
+            for resp in key_responsibilities
+        ],
+        'industry': (industry, industry.split()),
+        'seniority': (requirements.get('seniority_level') or '').lower(),
+        'preferred_skills': lowered('preferred_skills')
+    }
+
+def _any_contains(terms, text):
+    """True if any term is a substring of some part of a \x00-joined text"""
+    # Plain `in` scans beat a compiled alternation regex here: the term lists are short (2-10 words)
+    return any(term in text for term in terms)
+
 def rank_candidates_by_enhanced_job_match(candidates, requirements):
     """Enhanced ranking of candidates based on job requirements"""
-    ranked_candidates = []
+    if not candidates:
+        return []
+    
+    try:
+        prepared = _prepare_requirements(requirements)
+    except Exception:
+        prepared = None  # malformed requirements: each score call fails and logs as before
     
     for candidate in candidates:
-        score = calculate_enhanced_match_score(candidate, requirements)
+        score = calculate_enhanced_match_score(candidate, requirements, prepared)
         candidate['match_score'] = score
         candidate['relevance_score'] = score  # Also set as relevance_score for consistency
-        ranked_candidates.append(candidate)
     
-    # Sort by match score (highest first)
-    return sorted(ranked_candidates, key=lambda x: x.get('match_score', 0), reverse=True)
+    # Sort by match score (highest first); every candidate was just scored, so index the key directly
+    return sorted(candidates, key=itemgetter('match_score'), reverse=True)
 
-def calculate_enhanced_match_score(candidate, requirements):
+def calculate_enhanced_match_score(candidate, requirements, prepared=None):
     """Enhanced comprehensive match score calculation with better flexibility"""
     score = 0
     max_score = 0
     
     try:
+        if prepared is None:
+            prepared = _prepare_requirements(requirements)
+        
+        # Lowercase the candidate's fields in one pass over the experience; the sections below share them
+        candidate_skills = [skill.get('skill', '').lower() for skill in candidate.get('skills', [])]
+        candidate_technologies = []
+        candidate_roles = []
+        responsibilities_parts = []
+        experience_parts = []
+        for exp in candidate.get('experience', []):
+            position = exp.get('position', '')
+            responsibilities = ' '.join(exp.get('responsibilities', []))
+            candidate_technologies.extend(tech.lower() for tech in exp.get('technologies', []))
+            candidate_roles.append(position.lower())
+            responsibilities_parts.append(" " + responsibilities)
+            experience_parts.append(f" {position} {responsibilities}")
+        all_responsibilities_text = "".join(responsibilities_parts).lower()
+        
         # 1. Required Skills Matching (20% weight - reduced further to make room for responsibilities)
         required_skills = requirements.get('required_skills', [])
         if required_skills:
             max_score += 20
-            candidate_skills = [skill.get('skill', '').lower() for skill in candidate.get('skills', [])]
             
             # Also collect skills from experience technologies, special skills, AND responsibilities
-            candidate_technologies = []
-            all_responsibilities_text = ""
-            for exp in candidate.get('experience', []):
-                candidate_technologies.extend([tech.lower() for tech in exp.get('technologies', [])])
-                all_responsibilities_text += " " + " ".join(exp.get('responsibilities', []))
-            
-            all_responsibilities_text = all_responsibilities_text.lower()
-            
             special_skills = candidate.get('special_skills', '').lower()
             special_skills_list = [s.strip() for s in special_skills.replace(',', ' ').split() if len(s.strip()) > 2]
             
             all_candidate_skills = set(candidate_skills + candidate_technologies + special_skills_list)
+            # Joined once so "term in any skill" is a single C-level scan; split() words never contain \x00
+            skills_blob = "\x00".join(all_candidate_skills)
+            skill_words = {word for skill in all_candidate_skills for word in skill.split() if len(word) > 1}
             
             matched_skills = 0
-            for req_skill in required_skills[:10]:  # Limit to top 10 to avoid over-weighting
-                skill_lower = req_skill.lower()
-                skill_found = False
-                
+            for skill_lower, req_words in prepared['skills']:
                 # Check in formal skills and technologies - MORE FLEXIBLE
-                for candidate_skill in all_candidate_skills:
-                    if (skill_lower in candidate_skill or candidate_skill in skill_lower or
-                        any(word in candidate_skill for word in skill_lower.split() if len(word) > 1) or  # Reduced from 2 to 1
-                        any(word in skill_lower for word in candidate_skill.split() if len(word) > 1)):
-                        skill_found = True
-                        break
+                # Exact hash lookup first; the substring scans below only run for partial matches
+                skill_found = skill_lower in all_candidate_skills or bool(all_candidate_skills) and (
+                    skill_lower in skills_blob or
+                    _any_contains(all_candidate_skills, skill_lower) or
+                    _any_contains(req_words, skills_blob) or
+                    _any_contains(skill_words, skill_lower)
+                )
                 
                 # ALSO check in responsibilities text for skills
                 if not skill_found:
-                    skill_words = skill_lower.split()
-                    for word in skill_words:
-                        if len(word) > 1 and word in all_responsibilities_text:  # Very flexible
-                            skill_found = True
-                            break
+                    skill_found = _any_contains(req_words, all_responsibilities_text)  # Very flexible
                 
                 if skill_found:
                     matched_skills += 1
@@ -738,22 +804,15 @@ def calculate_enhanced_match_score(candidate, requirements):
         required_technologies = requirements.get('technologies', [])
         if required_technologies:
             max_score += 20
-            candidate_technologies = []
-            candidate_skills = [skill.get('skill', '').lower() for skill in candidate.get('skills', [])]
-            
-            # Collect technologies from experience
-            for exp in candidate.get('experience', []):
-                candidate_technologies.extend([tech.lower() for tech in exp.get('technologies', [])])
-            
             all_candidate_tech = set(candidate_technologies + candidate_skills)
+            tech_blob = "\x00".join(all_candidate_tech)
             
             matched_tech = 0
-            for req_tech in required_technologies:
-                tech_lower = req_tech.lower()
-                tech_found = any(
-                    tech_lower in candidate_tech or candidate_tech in tech_lower or
-                    any(word in candidate_tech for word in tech_lower.split() if len(word) > 2)
-                    for candidate_tech in all_candidate_tech
+            for tech_lower, tech_words in prepared['technologies']:
+                tech_found = tech_lower in all_candidate_tech or bool(all_candidate_tech) and (
+                    tech_lower in tech_blob or
+                    _any_contains(all_candidate_tech, tech_lower) or
+                    _any_contains(tech_words, tech_blob)
                 )
                 if tech_found:
                     matched_tech += 1
@@ -784,23 +843,15 @@ def calculate_enhanced_match_score(candidate, requirements):
         required_experience_areas = requirements.get('required_experience_areas', [])
         if required_experience_areas:
             max_score += 10
-            candidate_experience_text = ""
-            candidate_roles = []
-            
-            for exp in candidate.get('experience', []):
-                candidate_experience_text += f" {exp.get('position', '')} {' '.join(exp.get('responsibilities', []))}"
-                candidate_roles.append(exp.get('position', '').lower())
-            
-            candidate_experience_text = candidate_experience_text.lower()
+            candidate_experience_text = "".join(experience_parts).lower()
             
             matched_areas = 0
-            for area in required_experience_areas:
-                area_lower = area.lower()
+            for area_lower, area_words in prepared['experience_areas']:
                 # More flexible area matching
                 area_found = (
                     area_lower in candidate_experience_text or
                     any(area_lower in role for role in candidate_roles) or
-                    any(word in candidate_experience_text for word in area_lower.split() if len(word) > 3)
+                    _any_contains(area_words, candidate_experience_text)
                 )
                 if area_found:
                     matched_areas += 1
@@ -816,12 +867,11 @@ def calculate_enhanced_match_score(candidate, requirements):
             candidate_highest = candidate.get('highest_qualification', '').lower()
             
             matched_quals = 0
-            for req_qual in required_qualifications:
-                qual_lower = req_qual.lower()
+            for qual_lower, qual_words in prepared['qualifications']:
                 qual_found = (
                     qual_lower in candidate_highest or
                     any(qual_lower in cand_qual or cand_qual in qual_lower for cand_qual in candidate_quals) or
-                    any(word in candidate_highest for word in qual_lower.split() if len(word) > 3)
+                    _any_contains(qual_words, candidate_highest)
                 )
                 if qual_found:
                     matched_quals += 1
@@ -834,7 +884,7 @@ def calculate_enhanced_match_score(candidate, requirements):
         if required_industry:
             max_score += 4
             candidate_industry = candidate.get('industry', '').lower()
-            required_industry_lower = required_industry.lower()
+            required_industry_lower, industry_keywords = prepared['industry']
             
             if candidate_industry:
                 if candidate_industry == required_industry_lower:
@@ -844,7 +894,6 @@ def calculate_enhanced_match_score(candidate, requirements):
                     score += 3
                 else:
                     # Keyword overlap
-                    industry_keywords = required_industry_lower.split()
                     matches = sum(1 for keyword in industry_keywords if keyword in candidate_industry)
                     if matches > 0:
                         score += (matches / len(industry_keywords)) * 2
@@ -854,7 +903,7 @@ def calculate_enhanced_match_score(candidate, requirements):
         if required_seniority:
             max_score += 4
             candidate_role = candidate.get('current_role', '').lower()
-            required_seniority_lower = required_seniority.lower()
+            required_seniority_lower = prepared['seniority']
             candidate_exp_count = len(candidate.get('experience', []))
             
             # Check role title for seniority indicators
@@ -879,19 +928,11 @@ def calculate_enhanced_match_score(candidate, requirements):
         key_responsibilities = requirements.get('key_responsibilities', [])
         if key_responsibilities:
             max_score += 15
-            candidate_responsibilities_text = ""
-            
-            for exp in candidate.get('experience', []):
-                candidate_responsibilities_text += " " + " ".join(exp.get('responsibilities', []))
-            
-            candidate_responsibilities_text = candidate_responsibilities_text.lower()
+            candidate_responsibilities_text = all_responsibilities_text
             
             matched_responsibilities = 0
-            for responsibility in key_responsibilities:
-                resp_lower = responsibility.lower()
-                
+            for resp_words, resp_phrases, resp_work_words in prepared['responsibilities']:
                 # MUCH MORE FLEXIBLE matching - check if ANY words from responsibility appear
-                resp_words = resp_lower.split()
                 word_matches = sum(1 for word in resp_words if len(word) > 1 and word in candidate_responsibilities_text)  # Reduced from 2 to 1
                 
                 # VERY lenient threshold - only need 10% of words to match
@@ -899,12 +940,11 @@ def calculate_enhanced_match_score(candidate, requirements):
                     matched_responsibilities += 1
                     
                 # Also check for any phrase matches (comma separated)
-                elif any(phrase.strip() in candidate_responsibilities_text for phrase in resp_lower.split(',') if len(phrase.strip()) > 3):
+                elif _any_contains(resp_phrases, candidate_responsibilities_text):
                     matched_responsibilities += 0.5  # Partial credit for phrase matches
                 
                 # SUPER FLEXIBLE: Check if responsibility contains ANY common work words that appear in candidate text
-                common_work_words = ['manage', 'develop', 'create', 'implement', 'analyze', 'design', 'support', 'lead', 'coordinate', 'maintain']
-                if any(word in resp_lower and word in candidate_responsibilities_text for word in common_work_words):
+                if _any_contains(resp_work_words, candidate_responsibilities_text):
                     matched_responsibilities += 0.3  # Small credit for common work activities
             
             if key_responsibilities:
@@ -927,11 +967,11 @@ def calculate_enhanced_match_score(candidate, requirements):
         final_score = (score / max_score) * 100
         
         # Apply bonuses for preferred skills and recent experience
-        preferred_skills = requirements.get('preferred_skills', [])
+        preferred_skills = prepared['preferred_skills']
         if preferred_skills:
-            candidate_skills = [skill.get('skill', '').lower() for skill in candidate.get('skills', [])]
+            candidate_skills_blob = "\x00".join(candidate_skills)
             preferred_matches = sum(1 for pref_skill in preferred_skills 
-                                 if any(pref_skill.lower() in cand_skill for cand_skill in candidate_skills))
+                                 if candidate_skills and pref_skill in candidate_skills_blob)
             if preferred_matches > 0:
                 final_score += min(5, (preferred_matches / len(preferred_skills)) * 5)
         
@@ -950,169 +990,126 @@ def calculate_enhanced_match_score(candidate, requirements):
         logging.error(f"Error calculating enhanced match score: {str(e)}")
         return 0
 
+def _result_row(candidate):
+    """Summary columns shown for one candidate in the search results table"""
+    experience = candidate.get('experience', [])
+    skills = candidate.get('skills', [])
+    row = {
+        'Name': candidate.get('name', 'N/A'),
+        'Email': candidate.get('email', 'N/A'),
+        'Role': candidate.get('current_role', 'N/A'),
+        'Industry': candidate.get('industry', 'N/A'),
+        'Current Company': experience[0].get('company', 'N/A') if experience else 'N/A',
+        'Top Skills': ', '.join(skill.get('skill', '') for skill in skills[:3]),
+        'Phone': candidate.get('phone', 'N/A'),
+        'Notice': candidate.get('notice_period', 'N/A'),
+        'Education': candidate.get('highest_qualification', 'N/A'),
+        'Added': format_datetime_gmt_plus_2(candidate['created_at']) if candidate.get('created_at') else ''
+    }
+    relevance_score = candidate.get('relevance_score') or candidate.get('match_score')
+    if relevance_score is not None:
+        row = {'Match': relevance_score, **row}
+    return row
+
+def _match_summary(results):
+    """High/medium/low match counts and the average score, in one pass over the results"""
+    high = medium = low = 0
+    total = 0
+    for candidate in results:
+        score = candidate.get('match_score', 0)
+        total += score
+        if score >= 80:
+            high += 1
+        elif score >= 60:
+            medium += 1
+        else:
+            low += 1
+    return high, medium, low, total / len(results) if results else 0
+
+def _results_page_frame(results, page):
+    """Results table for one page, built once per result set and page rather than on every rerun"""
+    import pandas as pd
+    
+    # The cache holds a reference to the result list, so an identity match means the same search
+    cached = st.session_state.get('results_table_cache')
+    if cached and cached[0] is results and cached[1] == page:
+        return cached[2]
+    
+    start = page * RESULTS_PAGE_SIZE
+    frame = pd.DataFrame([_result_row(candidate) for candidate in results[start:start + RESULTS_PAGE_SIZE]])
+    st.session_state.results_table_cache = (results, page, frame)
+    return frame
+
+def _change_results_page(step):
+    """Move the search results view by step pages"""
+    st.session_state.results_page += step
+
+def show_results_pagination(page, total_pages):
+    """Prev/next controls for the paginated search results"""
+    col_prev, col_info, col_next = st.columns([1, 2, 1])
+    with col_prev:
+        st.button("◀ Previous", key="results_prev", use_container_width=True,
+                  disabled=page == 0, on_click=_change_results_page, args=(-1,))
+    with col_info:
+        st.caption(f"Page {page + 1} of {total_pages} ({RESULTS_PAGE_SIZE} candidates per page)")
+    with col_next:
+        st.button("Next ▶", key="results_next", use_container_width=True,
+                  disabled=page >= total_pages - 1, on_click=_change_results_page, args=(1,))
+
 def display_search_results(results, show_match_score=None):
-    """Display search results with enhanced information, View Details buttons, and GMT+2 timestamps"""
-    from navigation import view_candidate_details
+    """Display search results as a selectable table with GMT+2 timestamps"""
+    from navigation import open_candidate_details
     
     if results:
         # Determine if we should show match scores
         if show_match_score is None:
             show_match_score = any(candidate.get('match_score') is not None for candidate in results)
         
-        st.markdown('<div class="section-header">', unsafe_allow_html=True)
-        st.subheader(f"📊 Search Results ({len(results)} candidates found)")
-        st.markdown('</div>', unsafe_allow_html=True)
+        st.markdown(f'<div class="section-header"><h3>📊 Search Results ({len(results)} candidates found)</h3></div>', unsafe_allow_html=True)
         
         # Show result summary
         if show_match_score:
-            high_match = len([c for c in results if c.get('match_score', 0) >= 80])
-            medium_match = len([c for c in results if 60 <= c.get('match_score', 0) < 80])
-            low_match = len([c for c in results if c.get('match_score', 0) < 60])
+            high_match, medium_match, low_match, avg_score = _match_summary(results)
             
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("🟢 High Match (80%+)", high_match)
-            with col2:
-                st.metric("🟡 Medium Match (60-79%)", medium_match)
-            with col3:
-                st.metric("🔴 Lower Match (<60%)", low_match)
-            with col4:
-                avg_score = sum(c.get('match_score', 0) for c in results) / len(results)
-                st.metric("📈 Average Match", f"{avg_score:.1f}%")
+            st.markdown(metric_grid_html([
+                ("🟢 High Match (80%+)", high_match),
+                ("🟡 Medium Match (60-79%)", medium_match),
+                ("🔴 Lower Match (<60%)", low_match),
+                ("📈 Average Match", f"{avg_score:.1f}%")
+            ]), unsafe_allow_html=True)
         
-        st.markdown("💡 **Click 'View Details' to see and edit full candidate information**")
+        st.markdown("💡 **Select a candidate and click 'View Details' to see and edit full candidate information**")
         st.markdown("---")
         
-        # Display candidates with enhanced info
-        for idx, candidate in enumerate(results):
-            with st.container():
-                st.markdown('<div class="candidate-card">', unsafe_allow_html=True)
-                
-                # Enhanced candidate summary
-                col1, col2, col3, col4, col5 = st.columns([3, 2, 2, 2, 1])
-                
-                with col1:
-                    st.markdown(f"**👤 {candidate.get('name', 'N/A')}**")
-                    st.write(f"📧 {candidate.get('email', 'N/A')}")
-                    
-                    # Show top skills
-                    candidate_skills = candidate.get('skills', [])
-                    if candidate_skills:
-                        top_skills = [skill.get('skill', '') for skill in candidate_skills[:3]]
-                        if top_skills:
-                            st.caption(f"🛠️ {', '.join(top_skills)}")
-                
-                with col2:
-                    st.write(f"**Role:** {candidate.get('current_role', 'N/A')}")
-                    st.write(f"**Industry:** {candidate.get('industry', 'N/A')}")
-                    
-                    # Show experience count
-                    exp_count = len(candidate.get('experience', []))
-                    st.caption(f"💼 {exp_count} position{'s' if exp_count != 1 else ''}")
-                
-                with col3:
-                    st.write(f"**Phone:** {candidate.get('phone', 'N/A')}")
-                    st.write(f"**Notice:** {candidate.get('notice_period', 'N/A')}")
-                    
-                    # Show recent company with emphasis if it matches search
-                    recent_exp = candidate.get('experience', [])
-                    if recent_exp:
-                        recent_company = recent_exp[0].get('company', 'N/A')
-                        # Check if this candidate was found via company search
-                        if st.session_state.cached_search_criteria.get('company'):
-                            search_company = st.session_state.cached_search_criteria['company'].lower()
-                            if search_company in recent_company.lower():
-                                st.caption(f"🏢 **{recent_company}** 🎯")  # Highlight current company match
-                            else:
-                                st.caption(f"🏢 {recent_company}")
-                        else:
-                            st.caption(f"🏢 {recent_company}")
-                
-                with col4:
-                    st.write(f"**Education:** {candidate.get('highest_qualification', 'N/A')}")
-                    
-                    # Enhanced relevance score display
-                    relevance_score = candidate.get('relevance_score') or candidate.get('match_score')
-                    if relevance_score is not None:
-                        if relevance_score >= 80:
-                            st.markdown(f"**Match:** 🟢 {relevance_score}%")
-                        elif relevance_score >= 60:
-                            st.markdown(f"**Match:** 🟡 {relevance_score}%")
-                        elif relevance_score >= 40:
-                            st.markdown(f"**Match:** 🟠 {relevance_score}%")
-                        else:
-                            st.markdown(f"**Match:** 🔴 {relevance_score}%")
-                    
-                    # Show skill count
-                    skill_count = len(candidate.get('skills', []))
-                    st.caption(f"🎯 {skill_count} skills")
-                
-                with col5:
-                    # View Details button
-                    button_key = f"view_details_{idx}_{candidate.get('email', 'unknown')}"
-                    if st.button("👁️ View Details", key=button_key, type="primary", help="View and edit candidate details"):
-                        view_candidate_details(candidate)
-                
-                # Add GMT+2 timestamps
-                timestamp_cols = st.columns([1, 1, 2])
-                with timestamp_cols[0]:
-                    if candidate.get('created_at'):
-                        created_at_gmt2 = format_datetime_gmt_plus_2(candidate['created_at'])
-                        st.caption(f"📅 Added: {created_at_gmt2}")
-                
-                with timestamp_cols[1]:
-                    if candidate.get('updated_at') and candidate.get('updated_at') != candidate.get('created_at'):
-                        updated_at_gmt2 = format_datetime_gmt_plus_2(candidate['updated_at'])
-                        st.caption(f"📝 Updated: {updated_at_gmt2}")
-                
-                # Show additional candidate preview info
-                with st.expander("👀 Quick Preview", expanded=False):
-                    preview_col1, preview_col2 = st.columns(2)
-                    
-                    with preview_col1:
-                        # Show recent experience
-                        if candidate.get('experience'):
-                            st.markdown("**Recent Experience:**")
-                            recent_exp = candidate['experience'][0]
-                            st.write(f"• {recent_exp.get('position', 'N/A')} at {recent_exp.get('company', 'N/A')}")
-                            st.write(f"• Duration: {recent_exp.get('years', 'N/A')}")
-                            
-                            # Show a few responsibilities
-                            responsibilities = recent_exp.get('responsibilities', [])
-                            if responsibilities:
-                                st.write("**Key Responsibilities:**")
-                                for resp in responsibilities[:3]:  # Show first 3
-                                    if resp:
-                                        st.write(f"• {resp[:100]}{'...' if len(resp) > 100 else ''}")
-                        
-                        # Show company history if company search was performed
-                        if st.session_state.cached_search_criteria.get('company'):
-                            st.markdown("**Company History:**")
-                            companies = [exp.get('company', '') for exp in candidate.get('experience', []) if exp.get('company')]
-                            for i, company in enumerate(companies[:5]):  # Show first 5 companies
-                                if i == 0:
-                                    st.write(f"• {company} (Current)")
-                                else:
-                                    st.write(f"• {company} (Previous)")
-                    
-                    with preview_col2:
-                        # Show skills with proficiency
-                        if candidate.get('skills'):
-                            st.markdown("**Skills:**")
-                            for skill in candidate['skills'][:5]:  # Show first 5 skills
-                                skill_name = skill.get('skill', 'N/A')
-                                proficiency = skill.get('proficiency', 0)
-                                stars = "⭐" * int(proficiency)
-                                st.write(f"• {skill_name} {stars}")
-                        
-                        # Show special skills
-                        if candidate.get('special_skills'):
-                            st.markdown("**Special Skills:**")
-                            special_skills = candidate['special_skills'][:150]
-                            st.write(f"{special_skills}{'...' if len(candidate.get('special_skills', '')) > 150 else ''}")
-                
-                st.markdown('</div>', unsafe_allow_html=True)
-                st.markdown("")  # Add space between cards
+        # Only the current page is rendered; the rest stay in cached_search_results
+        total_pages = math.ceil(len(results) / RESULTS_PAGE_SIZE)
+        page = min(st.session_state.results_page, total_pages - 1)
+        st.session_state.results_page = page
+        if total_pages > 1:
+            show_results_pagination(page, total_pages)
+        
+        start = page * RESULTS_PAGE_SIZE
+        page_results = results[start:start + RESULTS_PAGE_SIZE]
+        
+        # One table element for the whole page instead of a card of widgets per candidate;
+        # keyed per page so a row picked on one page is not carried over to the next
+        event = st.dataframe(
+            _results_page_frame(results, page),
+            key=f"results_table_{page}",
+            on_select="rerun",
+            selection_mode="single-row",
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                'Match': st.column_config.ProgressColumn("Match", min_value=0, max_value=100, format="%d%%")
+            }
+        )
+        
+        selected_rows = event.selection.rows
+        # A callback switches the page within the click's own rerun, without a second st.rerun()
+        st.button("👁️ View Details", key="view_details_btn", type="primary", disabled=not selected_rows,
+                  help="View and edit the selected candidate", on_click=open_candidate_details,
+                  args=(page_results[selected_rows[0]] if selected_rows else None,))
     else:
         st.markdown('<div class="warning-message">🔍 No candidates found matching your criteria.</div>', unsafe_allow_html=True)
         st.markdown("### 💡 Try These Tips:")
@@ -1,91 +1,124 @@
 import streamlit as st
 import time
+import copy
 import logging
-from database import DatabaseManager
-from cv_processor import CVProcessor
 
-def initialize_session_state():
-    """Initialize all session state variables with database error handling"""
+@st.cache_resource
+def get_db_manager():
+    """Get the process-wide database manager shared by all user sessions"""
+    from database import DatabaseManager  # deferred: pulls in the Azure SDK
+    return DatabaseManager()
+
+@st.cache_resource
+def get_cv_processor():
+    """Get the process-wide CV processor (and its OpenAI client) shared by all user sessions"""
+    from cv_processor import CVProcessor  # deferred: pulls in openai and pymupdf
+    return CVProcessor()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def lookup_existing_candidate(email):
+    """Existing-record check for the save flow, cached briefly so resubmits skip the DB"""
+    return get_db_manager().get_candidate_by_email(email)
+
+@st.cache_data(ttl=60, max_entries=64, show_spinner=False)
+def search_candidates_cached(search_criteria):
+    """Manual search results, memoized on the criteria so repeated searches skip the DB"""
+    return get_db_manager().search_candidates(search_criteria)
+
+@st.cache_data(ttl=60, max_entries=64, show_spinner=False)
+def rank_by_requirements_cached(requirements):
+    """Job-requirements search results ranked by match score, memoized so a repeated search skips scoring"""
+    from search_functions import rank_candidates_by_enhanced_job_match  # deferred: search_functions imports this module
+    candidates = get_db_manager().search_candidates_by_job_requirements(requirements)
+    return rank_candidates_by_enhanced_job_match(candidates, requirements)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def dashboard_stats_cached():
+    """Dashboard statistics, cached so dashboard reruns skip the aggregate queries"""
+    return get_db_manager().get_dashboard_stats()
+
+def clear_candidate_caches():
+    """Drop cached candidate reads after the database has changed"""
+    lookup_existing_candidate.clear()
+    search_candidates_cached.clear()
+    rank_by_requirements_cached.clear()
+    dashboard_stats_cached.clear()
+
+# Per-session defaults; list/dict values are copied so sessions never share them
+_SESSION_DEFAULTS = {
     # Core application state
-    if 'extracted_data' not in st.session_state:
-        st.session_state.extracted_data = None
-    if 'cv_processed' not in st.session_state:
-        st.session_state.cv_processed = False
-    if 'cv_processor' not in st.session_state:
-        st.session_state.cv_processor = CVProcessor()
-    if 'show_overwrite_dialog' not in st.session_state:
-        st.session_state.show_overwrite_dialog = False
-    if 'pending_candidate_data' not in st.session_state:
-        st.session_state.pending_candidate_data = None
-    if 'existing_candidate_email' not in st.session_state:
-        st.session_state.existing_candidate_email = None
-    if 'db_initialized' not in st.session_state:
-        st.session_state.db_initialized = False
-    if 'db_error' not in st.session_state:
-        st.session_state.db_error = None
-    if 'manual_entry_mode' not in st.session_state:
-        st.session_state.manual_entry_mode = False
-    if 'user_session_initialized' not in st.session_state:
-        st.session_state.user_session_initialized = False
+    'extracted_data': None,
+    'cv_processed': False,
+    'show_overwrite_dialog': False,
+    'pending_candidate_data': None,
+    'existing_candidate_email': None,
+    'db_initialized': False,
+    'db_error': None,
+    'manual_entry_mode': False,
+    'show_delete_confirmation': False,
+    'user_session_initialized': False,
     
     # PAGE NAVIGATION STATE
-    if 'current_page' not in st.session_state:
-        st.session_state.current_page = 'main'  # 'main', 'candidate_details'
+    'current_page': 'main',  # 'main', 'candidate_details'
     
     # SEARCH STATE - Cache search criteria and results
-    if 'cached_search_criteria' not in st.session_state:
-        st.session_state.cached_search_criteria = {}
-    if 'cached_search_results' not in st.session_state:
-        st.session_state.cached_search_results = []
-    if 'search_performed' not in st.session_state:
-        st.session_state.search_performed = False
+    'cached_search_criteria': {},
+    'cached_search_results': [],
+    'search_performed': False,
+    'results_page': 0,
     
     # CANDIDATE DETAILS STATE
-    if 'selected_candidate' not in st.session_state:
-        st.session_state.selected_candidate = None
+    'selected_candidate': None,
+    'edit_active_section': None,
+    'edit_original_fingerprint': None,
     
     # Form data session states for candidate editing (including comments)
-    edit_fields = [
+    **{field: "" for field in (
         'edit_name', 'edit_email', 'edit_phone', 'edit_current_role', 'edit_industry',
         'edit_notice_period', 'edit_current_salary', 'edit_desired_salary',
-        'edit_highest_qualification', 'edit_special_skills', 'edit_comments'  # Added comments
-    ]
-    
-    for field in edit_fields:
-        if field not in st.session_state:
-            st.session_state[field] = ""
+        'edit_highest_qualification', 'edit_special_skills', 'edit_comments'
+    )},
     
     # List fields for editing
-    list_fields = ['edit_qualifications_list', 'edit_skills_list', 'edit_experience_list', 'edit_achievements_list']
-    for field in list_fields:
-        if field not in st.session_state:
-            st.session_state[field] = []
+    **{field: [] for field in (
+        'edit_qualifications_list', 'edit_skills_list', 'edit_experience_list', 'edit_achievements_list'
+    )},
     
     # Form data session states for CV upload (including comments)
-    form_fields = [
+    **{field: "" for field in (
         'form_name', 'form_email', 'form_phone', 'form_current_role', 'form_industry',
         'form_notice_period', 'form_current_salary', 'form_desired_salary',
-        'form_highest_qualification', 'form_special_skills', 'form_comments'  # Added comments
-    ]
+        'form_highest_qualification', 'form_special_skills', 'form_comments'
+    )},
+}
+
+def initialize_session_state():
+    """Initialize all session state variables with database error handling"""
+    # Anything that deletes a default key must also drop this flag so the defaults are restored
+    if st.session_state.get('_initialized'):
+        return
     
-    for field in form_fields:
-        if field not in st.session_state:
-            st.session_state[field] = ""
+    for key, default in _SESSION_DEFAULTS.items():
+        if key not in st.session_state:
+            st.session_state[key] = copy.copy(default)
+    
+    st.session_state._initialized = True
 
 def initialize_database_with_retry():
     """Initialize database with retry logic and FORCE cloud refresh on new sessions"""
     # Check if database is already initialized
-    if st.session_state.db_initialized and 'db_manager' in st.session_state:
+    if st.session_state.db_initialized:
         # CRITICAL: If user just logged in, FORCE refresh from cloud
         if not st.session_state.user_session_initialized:
             try:
                 logging.info("NEW USER SESSION DETECTED - FORCING DATABASE REFRESH FROM CLOUD")
-                success = st.session_state.db_manager.force_refresh_from_cloud()
+                success = get_db_manager().force_refresh_from_cloud()
                 if success:
                     st.session_state.user_session_initialized = True
                     logging.info("✅ Database successfully refreshed from cloud for new user session")
                     # Clear any cached search data since we have fresh data
                     clear_search_state()
+                    clear_candidate_caches()
                 else:
                     logging.error("❌ Failed to refresh database from cloud, but continuing with local version")
                     # Still mark as initialized to avoid repeated attempts
@@ -104,7 +137,7 @@ def initialize_database_with_retry():
     while retry_count < max_retries:
         try:
             logging.info("Initializing new database manager...")
-            st.session_state.db_manager = DatabaseManager()
+            get_db_manager()
             st.session_state.db_initialized = True
             st.session_state.db_error = None
             
@@ -131,13 +164,14 @@ def initialize_database_with_retry():
 def force_database_refresh():
     """Force refresh database from cloud - call this when user logs in"""
     try:
-        if 'db_manager' in st.session_state and st.session_state.db_manager:
+        if st.session_state.get('db_initialized'):
             logging.info("🔄 FORCING DATABASE REFRESH FROM CLOUD STORAGE")
-            success = st.session_state.db_manager.force_refresh_from_cloud()
+            success = get_db_manager().force_refresh_from_cloud()
             
             if success:
                 # Clear cached search results since we have fresh data
                 clear_search_state()
+                clear_candidate_caches()
                 logging.info("✅ Database successfully refreshed from cloud")
                 return True
             else:
@@ -154,9 +188,9 @@ def force_database_refresh():
 def ensure_database_sync():
     """Ensure database is synced to cloud after operations - BLOCKING OPERATION"""
     try:
-        if 'db_manager' in st.session_state and st.session_state.db_manager:
+        if st.session_state.get('db_initialized'):
             logging.info("🔄 ENSURING DATABASE SYNC TO CLOUD")
-            success = st.session_state.db_manager.ensure_cloud_sync()
+            success = get_db_manager().ensure_cloud_sync()
             if success:
                 logging.info("✅ Database sync to cloud completed successfully")
             else:
@@ -174,29 +208,50 @@ def reset_user_session():
     st.session_state.user_session_initialized = False
     st.session_state.db_initialized = False
     
-    # Clear database manager to force re-initialization on next login
-    if 'db_manager' in st.session_state:
-        del st.session_state['db_manager']
-    
     # Clear all cached data
     clear_search_state()
     clear_form_session_state()
     
     logging.info("✅ User session reset - database will refresh from cloud on next login")
 
+def reset_table_editors():
+    """Start every table editor afresh, dropping edits made against the previously loaded lists"""
+    st.session_state.table_editor_generation = st.session_state.get('table_editor_generation', 0) + 1
+    st.session_state.pop('table_editor_revisions', None)
+
 def clear_form_session_state():
     """Clear form-related session state including comments"""
     keys_to_clear = [
         'qualifications_list', 'skills_list', 'experience_list', 'achievements_list',
-        'extracted_data', 'cv_processed', 'form_name', 'form_email', 'form_phone',
+        'extracted_data', 'cv_processed', 'processed_pdf_sha', 'form_name', 'form_email', 'form_phone',
         'form_current_role', 'form_industry', 'form_notice_period', 'form_current_salary',
         'form_desired_salary', 'form_highest_qualification', 'form_special_skills',
-        'form_comments', 'manual_entry_mode'  # Added form_comments
+        'form_comments', 'manual_entry_mode',  # Added form_comments
+        '_initialized'  # re-run initialize_session_state to restore the deleted defaults
     ]
     
     for key in keys_to_clear:
         if key in st.session_state:
             del st.session_state[key]
+    reset_table_editors()
+
+def clear_edit_session_state():
+    """Drop the candidate edit page state so a viewed candidate is not held for the rest of the session"""
+    keys_to_clear = [key for key in _SESSION_DEFAULTS if key.startswith('edit_')] + [
+        'selected_candidate', 'show_delete_confirmation',
+        '_initialized'  # re-run initialize_session_state to restore the deleted defaults
+    ]
+    
+    for key in keys_to_clear:
+        if key in st.session_state:
+            del st.session_state[key]
+    reset_table_editors()
+
+def leave_candidate_details():
+    """Button callback: return from the candidate details page to the search results"""
+    clear_edit_session_state()
+    st.session_state.current_page = 'main'
+    st.session_state.main_nav = "🔍 Search Candidates"
 
 def clear_all_candidate_state():
     """Clear all candidate-related session state for adding a new candidate"""
@@ -209,6 +264,7 @@ def clear_all_candidate_state():
     clear_overwrite_dialog_state()
     
     # Clear CV processing state
+    st.session_state.pop('cv_batch', None)
     st.session_state.cv_processed = False
     st.session_state.extracted_data = None
     st.session_state.manual_entry_mode = False
@@ -242,4 +298,6 @@ def clear_search_state():
     st.session_state.cached_search_criteria = {}
     st.session_state.cached_search_results = []
     st.session_state.search_performed = False
+    st.session_state.results_page = 0
+    st.session_state.pop('results_table_cache', None)
     logging.info("🗑️ Search state cleared")
\ No newline at end of file
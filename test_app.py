@@ -8,6 +8,7 @@ import sys
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from database import DatabaseManager
+from blob_database import SQLiteConnectionPool
 from cv_processor import CVProcessor
 from utils import (
     validate_candidate_data, 
@@ -141,6 +142,45 @@ class TestDatabaseManager(unittest.TestCase):
         self.assertEqual(stats['unique_industries'], 2)
         self.assertGreater(stats['avg_experience'], 0)
 
+class TestConnectionPool(unittest.TestCase):
+    """Test cases for SQLiteConnectionPool class"""
+    
+    def setUp(self):
+        """Set up test database and pool"""
+        self.test_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.test_db.close()
+        
+        conn = sqlite3.connect(self.test_db.name)
+        conn.execute("CREATE TABLE candidates (email TEXT UNIQUE)")
+        conn.commit()
+        conn.close()
+        
+        self.pool = SQLiteConnectionPool(self.test_db.name, max_size=2)
+    
+    def tearDown(self):
+        """Clean up test database"""
+        self.pool.clear()
+        if os.path.exists(self.test_db.name):
+            os.unlink(self.test_db.name)
+    
+    def test_release_rolls_back_open_transaction(self):
+        """Test a connection left mid-transaction does not keep the write lock"""
+        # Leave the block with uncommitted work, as an early return would
+        with self.pool.connection() as conn:
+            conn.execute("DELETE FROM candidates WHERE email = ?", ('missing@example.com',))
+            self.assertTrue(conn.in_transaction)
+        
+        idle_conn, generation = self.pool.acquire()
+        self.assertIs(idle_conn, conn)
+        self.assertFalse(idle_conn.in_transaction)
+        self.pool.release(idle_conn, generation)
+        
+        # Another writer must get the lock immediately
+        writer = sqlite3.connect(self.test_db.name, timeout=0)
+        writer.execute("INSERT INTO candidates (email) VALUES (?)", ('new@example.com',))
+        writer.commit()
+        writer.close()
+
 class TestCVProcessor(unittest.TestCase):
     """Test cases for CVProcessor class"""
     
@@ -221,6 +261,64 @@ class TestCVProcessor(unittest.TestCase):
         self.assertEqual(text, "Sample CV text content")
         mock_pymupdf.open.assert_called_once_with('test.pdf')
         mock_doc.close.assert_called_once()
+    
+    @patch('cv_processor.pymupdf')
+    def test_extract_text_from_pdf_bytes(self, mock_pymupdf):
+        """Test PDF text extraction from in-memory bytes"""
+        mock_doc = MagicMock()
+        mock_page = Mock()
+        mock_page.get_text.return_value = "Sample CV text content"
+        mock_doc.load_page.return_value = mock_page
+        mock_doc.__len__.return_value = 1
+        mock_pymupdf.open.return_value = mock_doc
+        
+        text = self.cv_processor.extract_text_from_pdf_bytes(b'%PDF-1.4')
+        
+        self.assertEqual(text, "Sample CV text content")
+        mock_pymupdf.open.assert_called_once_with(stream=b'%PDF-1.4', filetype="pdf")
+        mock_doc.close.assert_called_once()
+    
+    def test_process_cvs_batch(self):
+        """Test batched extraction uses one call and reuses cached extractions"""
+        response = Mock()
+        response.choices = [Mock()]
+        # Records come back out of order; cv_index decides which CV each belongs to
+        response.choices[0].message.content = json.dumps({'candidates': [{'cv_index': 2, 'name': 'Bob'}, {'cv_index': 1, 'name': 'Alice'}]})
+        self.cv_processor.client.chat.completions.create.return_value = response
+        
+        with tempfile.TemporaryDirectory() as cache_dir, patch('cv_processor.Config') as mock_config:
+            mock_config.EXTRACTION_CACHE_DIR = cache_dir
+            mock_config.AZURE_OPENAI_DEPLOYMENT_NAME = 'gpt-4o-mini'
+        
+            results = self.cv_processor.process_cvs_batch(['Alice CV text', 'Bob CV text'])
+            self.assertEqual([r['name'] for r in results], ['Alice', 'Bob'])
+            self.assertEqual(self.cv_processor.client.chat.completions.create.call_count, 1)
+        
+            # Both CVs are now cached, so a repeat upload makes no API call
+            results = self.cv_processor.process_cvs_batch(['Bob CV text', 'Alice CV text'])
+            self.assertEqual([r['name'] for r in results], ['Bob', 'Alice'])
+            self.assertEqual(self.cv_processor.client.chat.completions.create.call_count, 1)
+    
+    def test_extraction_cache_expiry(self):
+        """Test expired cache entries are never served and are pruned on the next write"""
+        with tempfile.TemporaryDirectory() as cache_dir, patch('cv_processor.Config') as mock_config:
+            mock_config.EXTRACTION_CACHE_DIR = cache_dir
+            mock_config.AZURE_OPENAI_DEPLOYMENT_NAME = 'gpt-4o-mini'
+            
+            entry = {'name': 'Old', 'email': '', 'experience': [], 'skills': []}
+            paths = [self.cv_processor._extraction_cache_path(text) for text in ('CV one', 'CV two', 'CV three')]
+            for path in paths[:2]:
+                self.cv_processor._store_cached_extraction(path, entry)
+                expired = os.path.getmtime(path) - 8 * 86400
+                os.utime(path, (expired, expired))
+            
+            # Reading an expired entry is a miss and removes it
+            self.assertIsNone(self.cv_processor._load_cached_extraction(paths[0]))
+            self.assertFalse(os.path.exists(paths[0]))
+            
+            # Writing a new entry prunes the remaining expired one
+            self.cv_processor._store_cached_extraction(paths[2], entry)
+            self.assertEqual(os.listdir(cache_dir), [os.path.basename(paths[2])])
 
 class TestUtils(unittest.TestCase):
     """Test cases for utility functions"""
@@ -509,6 +607,7 @@ def create_test_suite():
     
     # Add test classes
     suite.addTest(unittest.makeSuite(TestDatabaseManager))
+    suite.addTest(unittest.makeSuite(TestConnectionPool))
     suite.addTest(unittest.makeSuite(TestCVProcessor))
     suite.addTest(unittest.makeSuite(TestUtils))
     suite.addTest(unittest.makeSuite(TestIntegration))
@@ -681,3 +681,15 @@ def sanitize_comments(comments: str) -> str:
         comments = comments[:max_length] + "..."
     
     return comments
+
+def metric_grid_html(metrics: List[tuple]) -> str:
+    """
+    Render (label, value) pairs as one row of metric cards, so a whole metrics row is a single
+    Streamlit element instead of a column and st.metric per value
+    """
+    cards = "".join(
+        f'<div class="metric-card"><div class="metric-label">{label}</div>'
+        f'<div class="metric-value">{value}</div></div>'
+        for label, value in metrics
+    )
+    return f'<div class="metric-grid">{cards}</div>'